@@ -3,16 +3,134 @@ AI 기반 답글 생성 엔진
 감정 분석 결과를 기반으로 맥락에 맞는 고품질 답글 생성
 """
 
-from typing import Dict
+from typing import Dict, Optional, Tuple
 from openai import OpenAI
+import logging
 import random
+import re
+import time
+
+from usage_ledger import UsageLedger, BUDGET_OK, BUDGET_EXCEEDED
+from reply_history_index import ReplyHistoryIndex
+from review_retrieval_index import ReviewRetrievalIndex
+from reply_backends import ReplyBackend, OpenAIBackend, TemplateBackend
+from review_router import ReviewRouter, TIERS, TIER_PHOTO, TIER_FAST, TIER_STANDARD, TIER_STRONG
+from reply_validator import ReplyValidator
+
+logger = logging.getLogger(__name__)
+
+
+def simple_sentiment_analysis(review_content: str) -> Dict:
+    """간단한 감정 분석 (OpenAI API 없이 사용할 경우)"""
+
+    # 긍정 키워드
+    positive_keywords = ["좋", "맛있", "친절", "깨끗", "최고", "추천", "만족", "감사", "훌륭", "완벽"]
+    # 부정 키워드
+    negative_keywords = ["별로", "실망", "불친절", "맛없", "더럽", "최악", "불만", "화", "짜증", "후회"]
+
+    positive_count = sum(1 for keyword in positive_keywords if keyword in review_content)
+    negative_count = sum(1 for keyword in negative_keywords if keyword in review_content)
+
+    if positive_count > negative_count:
+        sentiment = "positive"
+        strength = min(0.5 + (positive_count * 0.1), 1.0)
+    elif negative_count > positive_count:
+        sentiment = "negative"
+        strength = min(0.5 + (negative_count * 0.1), 1.0)
+    else:
+        sentiment = "neutral"
+        strength = 0.5
+
+    return {
+        "sentiment": sentiment,
+        "sentiment_strength": strength,
+        "topics": [],
+        "keywords": [],
+        "intent": "일반",
+        "reply_focus": [],
+        "reply_avoid": []
+    }
 
 
 class AIReplyGenerator:
     """답글 생성 엔진"""
 
-    def __init__(self, openai_api_key: str):
+    # 예산 압박 시 저가치 리뷰로 판단할 최대 길이 (짧은 긍정 리뷰)
+    LOW_VALUE_MAX_LENGTH = 30
+
+    # 기존 답글과 이 유사도 이상이면 중복 표현으로 판단
+    DUPLICATE_SIMILARITY = 0.8
+    # 중복 판정 시 재생성 최대 횟수 (초과 시 가장 덜 비슷한 템플릿 사용)
+    MAX_DUPLICATE_RETRIES = 2
+    # 작성 규칙 위반을 로컬에서 고치지 못했을 때 재생성 최대 횟수 (초과 시 템플릿 사용)
+    MAX_VALIDATION_RETRIES = 1
+    # 리뷰 1건에 이 토큰 수 이상 사용했으면 더 이상 재생성하지 않음
+    REGENERATION_TOKEN_BUDGET = 1500
+
+    # 과거 리뷰와 이 유사도 이상이면 게시된 답글을 변형하여 재사용 (API 호출 생략)
+    REUSE_SIMILARITY = 0.9
+    # 이 유사도 이상인 과거 리뷰-답글은 프롬프트에 예시로 포함
+    FEW_SHOT_SIMILARITY = 0.3
+    FEW_SHOT_COUNT = 2
+
+    # 재사용 답글 변형용 감정별 마무리 문장
+    CLOSING_SENTENCES = {
+        "positive": [
+            "다음에도 좋은 시간 보내실 수 있도록 노력하겠습니다!",
+            "또 방문해 주시길 기다리겠습니다 😊",
+            "앞으로도 변함없는 모습으로 보답하겠습니다!"
+        ],
+        "negative": [
+            "더 나은 모습으로 다시 찾아뵙겠습니다.",
+            "다시 한번 진심으로 사과드립니다.",
+            "같은 불편이 없도록 꼼꼼히 챙기겠습니다."
+        ],
+        "neutral": [
+            "소중한 의견 감사드립니다.",
+            "더 만족스러운 방문이 되도록 노력하겠습니다.",
+            "다음 방문도 기다리겠습니다!"
+        ]
+    }
+
+    # 등급별 최대 토큰 (장문/부정 리뷰는 충분한 길이 허용)
+    TIER_MAX_TOKENS = {
+        TIER_FAST: 160,
+        TIER_STANDARD: 250,
+        TIER_STRONG: 400
+    }
+
+    def __init__(
+        self,
+        openai_api_key: str,
+        ledger: Optional[UsageLedger] = None,
+        history_index: Optional[ReplyHistoryIndex] = None,
+        retrieval_index: Optional[ReviewRetrievalIndex] = None,
+        standard_model: str = "gpt-4o-mini",
+        strong_model: str = "gpt-4o",
+        local_backend: Optional[ReplyBackend] = None
+    ):
         self.client = OpenAI(api_key=openai_api_key)
+        self.ledger = ledger
+        self.router = ReviewRouter()
+
+        # 등급별 생성 백엔드 (로컬 모델이 없으면 단순 리뷰는 템플릿)
+        self.template_backend = TemplateBackend(self._pick_template_reply)
+        self.backends = {
+            TIER_PHOTO: self.template_backend,
+            TIER_FAST: local_backend or self.template_backend,
+            TIER_STANDARD: OpenAIBackend(self.client, standard_model),
+            TIER_STRONG: OpenAIBackend(self.client, strong_model)
+        }
+        # 등급별 처리 건수 및 누적 소요 시간
+        self.tier_stats = {tier: {"count": 0, "total_seconds": 0.0} for tier in TIERS}
+
+        self.history_index = history_index
+        self.retrieval_index = retrieval_index
+        self.validator = ReplyValidator()
+        # 작성 규칙 검증 결과 (로컬 수정, 재생성, 템플릿 대체 건수)
+        self.validation_stats = {"fixed": 0, "regenerated": 0, "rejected": 0}
+        # 유사 리뷰 답글 재사용으로 생략한 API 호출 수
+        self.api_calls_saved = 0
 
     def generate_reply(
         self,
@@ -20,96 +138,280 @@ class AIReplyGenerator:
         analysis_result: Dict = None,
         brand_context: str = "카페"
     ) -> Dict:
-        """답글 생성"""
+        """답글 생성 (리뷰 복잡도에 따라 생성 등급을 정한 뒤 해당 백엔드로 생성)"""
 
         # analysis_result가 없으면 간단한 분석 수행
         if analysis_result is None:
             analysis_result = self._simple_sentiment_analysis(review_content)
 
-        # 감정별 시스템 프롬프트
-        system_prompt = self._get_system_prompt(analysis_result["sentiment"])
+        tier = self.router.route(review_content, analysis_result)
+        started_at = time.perf_counter()
 
-        # 고도화 프롬프트 구성
-        user_prompt = self._build_user_prompt(
-            review_content,
-            analysis_result,
-            brand_context
-        )
+        result = self._generate_for_tier(review_content, analysis_result, brand_context, tier)
 
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.7,
-                max_tokens=250,
-                presence_penalty=0.4,
-                frequency_penalty=0.3
-            )
+        stats = self.tier_stats[tier]
+        stats["count"] += 1
+        stats["total_seconds"] += time.perf_counter() - started_at
+        result["tier"] = tier
+        return result
+
+    def tier_report(self) -> Dict:
+        """등급별 처리 건수 및 평균 소요 시간"""
+        return {
+            tier: {
+                "count": stats["count"],
+                "avg_seconds": stats["total_seconds"] / stats["count"] if stats["count"] else 0.0
+            }
+            for tier, stats in self.tier_stats.items()
+        }
+
+    def _generate_for_tier(
+        self,
+        review_content: str,
+        analysis_result: Dict,
+        brand_context: str,
+        tier: str
+    ) -> Dict:
+        """등급별 답글 생성"""
 
-            generated_reply = response.choices[0].message.content.strip()
+        sentiment = analysis_result["sentiment"]
+        budget_status = self.ledger.budget_status() if self.ledger else BUDGET_OK
+
+        # 사진 리뷰는 생성 없이 사진 리뷰용 템플릿 답글
+        if tier == TIER_PHOTO:
+            return self._build_result(
+                self._pick_template_reply({**analysis_result, "sentiment": "photo"}),
+                "template",
+                brand_context,
+                budget_status
+            )
 
-            # 답글 검증
-            validated_reply = self._validate_and_adjust_reply(
-                generated_reply,
-                analysis_result
+        # 비슷한 과거 리뷰 검색: 매우 비슷하면 게시된 답글 재사용, 어느 정도 비슷하면 예시로 활용
+        examples = []
+        if self.retrieval_index is not None:
+            matches = self.retrieval_index.search(review_content, top_k=self.FEW_SHOT_COUNT)
+            reused_reply = self._reuse_stored_reply(matches, sentiment)
+            if reused_reply:
+                # 재사용 답글도 생성 답글과 같은 작성 규칙 검증 (고칠 수 없으면 새로 생성)
+                reused_reply, report = self._validate_and_adjust_reply(reused_reply, analysis_result)
+                if report["passed"]:
+                    self.api_calls_saved += 1
+                    return self._build_result(reused_reply, "retrieval", brand_context, budget_status)
+            examples = [pair for sim, pair in matches if sim >= self.FEW_SHOT_SIMILARITY]
+
+        # 예산 압박: 부정 리뷰를 제외하고 템플릿으로 대체
+        # 예산 초과: 모든 리뷰를 템플릿으로 대체
+        if budget_status == BUDGET_EXCEEDED or (
+            budget_status != BUDGET_OK
+            and sentiment != "negative"
+            and self._is_low_value_review(review_content, analysis_result)
+        ):
+            return self._build_result(
+                self._pick_template_reply(analysis_result),
+                "template",
+                brand_context,
+                budget_status
             )
 
-            return {
-                "success": True,
-                "reply": validated_reply,
-                "model_used": "gpt-4o-mini",
-                "tokens_used": response.usage.total_tokens if response.usage else 0
-            }
+        # 예산 압박 시 부정 리뷰만 전체 프롬프트와 최상위 모델 사용, 나머지는 축약 프롬프트
+        compact = budget_status != BUDGET_OK and sentiment != "negative"
+        if compact and tier == TIER_STRONG:
+            tier = TIER_STANDARD
+        backend = self.backends[tier]
+        max_tokens = self.TIER_MAX_TOKENS[tier]
 
-        except Exception as e:
-            print(f"답글 생성 실패: {e}")
-            # 템플릿 폴백
-            fallback_reply = self._generate_template_reply(
-                analysis_result["sentiment"],
-                analysis_result.get("topics", []),
-                analysis_result.get("keywords", [])
+        # 감정별 시스템 프롬프트
+        system_prompt = self._get_system_prompt(sentiment)
+
+        if compact or tier == TIER_FAST:
+            user_prompt = self._build_compact_user_prompt(review_content, analysis_result)
+            max_tokens = min(max_tokens, self.TIER_MAX_TOKENS[TIER_FAST])
+        else:
+            # 고도화 프롬프트 구성
+            user_prompt = self._build_user_prompt(
+                review_content,
+                analysis_result,
+                brand_context,
+                examples
             )
-            return {
-                "success": True,
-                "reply": fallback_reply,
-                "model_used": "template",
-                "tokens_used": 0
-            }
 
-    def _simple_sentiment_analysis(self, review_content: str) -> Dict:
-        """간단한 감정 분석 (OpenAI API 없이 사용할 경우)"""
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        prompt_tokens = 0
+        completion_tokens = 0
+        model_used = backend.name
 
-        # 긍정 키워드
-        positive_keywords = ["좋", "맛있", "친절", "깨끗", "최고", "추천", "만족", "감사", "훌륭", "완벽"]
-        # 부정 키워드
-        negative_keywords = ["별로", "실망", "불친절", "맛없", "더럽", "최악", "불만", "화", "짜증", "후회"]
+        try:
+            # 작성 규칙 위반(로컬 수정 불가) 또는 기존 답글과 표현 중복이면 제한된 횟수/토큰 내에서 재생성
+            duplicate_retries = 0
+            validation_retries = 0
+            attempt = 0
+            while True:
+                generated = backend.generate(
+                    messages,
+                    max_tokens,
+                    0.7 + 0.15 * attempt,
+                    analysis_result
+                )
+                model_used = generated["model"]
+                prompt_tokens += generated["prompt_tokens"]
+                completion_tokens += generated["completion_tokens"]
+
+                # 답글 검증 (고칠 수 있는 위반은 로컬에서 수정)
+                validated_reply, report = self._validate_and_adjust_reply(
+                    generated["text"],
+                    analysis_result
+                )
+
+                # 템플릿 백엔드는 이미 가장 덜 비슷한 템플릿을 골랐으므로 재시도 불필요
+                if backend is self.template_backend:
+                    return self._build_result(validated_reply, model_used, brand_context, budget_status)
+
+                if report["passed"] and not self._is_duplicate(validated_reply):
+                    return self._build_result(
+                        validated_reply,
+                        model_used,
+                        brand_context,
+                        budget_status,
+                        prompt_tokens=prompt_tokens,
+                        completion_tokens=completion_tokens
+                    )
+
+                if prompt_tokens + completion_tokens >= self.REGENERATION_TOKEN_BUDGET:
+                    give_up_reason = "재생성 토큰 한도 초과"
+                    break
+                if not report["passed"]:
+                    if validation_retries >= self.MAX_VALIDATION_RETRIES:
+                        give_up_reason = f"작성 규칙 미충족 ({', '.join(report['violations'])})"
+                        break
+                    validation_retries += 1
+                    self.validation_stats["regenerated"] += 1
+                    logger.info("작성 규칙 미충족 (%s, 점수 %.2f), 재생성 (%s/%s)",
+                                ", ".join(report["violations"]), report["score"],
+                                validation_retries, self.MAX_VALIDATION_RETRIES)
+                    instruction = self.validator.feedback(report)
+                else:
+                    if duplicate_retries >= self.MAX_DUPLICATE_RETRIES:
+                        give_up_reason = "유사 답글 재생성 한도 초과"
+                        break
+                    duplicate_retries += 1
+                    logger.info("기존 답글과 유사한 답글 생성됨, 재생성 (%s/%s)",
+                                duplicate_retries, self.MAX_DUPLICATE_RETRIES)
+                    instruction = ("이 답글은 이전에 작성한 답글들과 표현이 너무 비슷합니다. "
+                                   "같은 내용을 다른 어휘와 문장 구조로 새롭게 작성하세요:")
+
+                attempt += 1
+                messages = messages[:2] + [
+                    {"role": "assistant", "content": validated_reply},
+                    {"role": "user", "content": instruction}
+                ]
+
+            logger.warning("%s, 템플릿 답글을 사용합니다.", give_up_reason)
+            self.validation_stats["rejected"] += 1
+            spent_cost = 0.0
+            if self.ledger:
+                spent_cost = self.ledger.record(
+                    brand_context, model_used, prompt_tokens, completion_tokens, replies=0
+                )
+            result = self._build_result(
+                self._pick_template_reply(analysis_result), "template", brand_context, budget_status
+            )
+            result["cost_usd"] += spent_cost
+            return result
 
-        positive_count = sum(1 for keyword in positive_keywords if keyword in review_content)
-        negative_count = sum(1 for keyword in negative_keywords if keyword in review_content)
+        except Exception as e:
+            logger.error("답글 생성 실패 (%s): %s", backend.name, e)
+            if self.ledger and (prompt_tokens or completion_tokens):
+                self.ledger.record(
+                    brand_context, model_used, prompt_tokens, completion_tokens, replies=0
+                )
+            # 템플릿 폴백
+            fallback_reply = self._pick_template_reply(analysis_result)
+            return self._build_result(fallback_reply, "template", brand_context, budget_status)
 
-        if positive_count > negative_count:
-            sentiment = "positive"
-            strength = min(0.5 + (positive_count * 0.1), 1.0)
-        elif negative_count > positive_count:
-            sentiment = "negative"
-            strength = min(0.5 + (negative_count * 0.1), 1.0)
-        else:
-            sentiment = "neutral"
-            strength = 0.5
+    def _build_result(
+        self,
+        reply: str,
+        model_used: str,
+        brand_context: str,
+        budget_status: str,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0
+    ) -> Dict:
+        """결과 딕셔너리 구성 및 사용량 장부 기록 (답글 수는 등록이 확인된 뒤 호출 측에서 기록)"""
+        cost = 0.0
+        if self.ledger:
+            cost = self.ledger.record(brand_context, model_used, prompt_tokens, completion_tokens, replies=0)
 
         return {
-            "sentiment": sentiment,
-            "sentiment_strength": strength,
-            "topics": [],
-            "keywords": [],
-            "intent": "일반",
-            "reply_focus": [],
-            "reply_avoid": []
+            "success": True,
+            "reply": reply,
+            "model_used": model_used,
+            "tokens_used": prompt_tokens + completion_tokens,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "cost_usd": cost,
+            "budget_status": budget_status
         }
 
+    def _is_duplicate(self, reply: str, source: Optional[str] = None) -> bool:
+        """최근 게시 답글과 표현이 지나치게 비슷한지 여부
+
+        source: 재사용한 원본 답글 (원본과의 유사도는 비교에서 제외)
+        """
+        if self.history_index is None:
+            return False
+        return self.history_index.max_similarity(reply, exclude=source) >= self.DUPLICATE_SIMILARITY
+
+    def _pick_template_reply(self, analysis_result: Dict) -> str:
+        """템플릿 답글 선택 (답글 이력이 있으면 가장 덜 비슷한 템플릿)"""
+        candidates = self._template_candidates(
+            analysis_result["sentiment"],
+            analysis_result.get("topics", []),
+            analysis_result.get("keywords", [])
+        )
+        if self.history_index is None:
+            return random.choice(candidates)
+        return min(candidates, key=self.history_index.max_similarity)
+
+    def _reuse_stored_reply(self, matches: list, sentiment: str) -> Optional[str]:
+        """매우 비슷한 과거 리뷰의 답글을 마무리 문장만 바꿔 재사용 (불가하면 None)"""
+        if not matches:
+            return None
+
+        similarity, pair = matches[0]
+        if similarity < self.REUSE_SIMILARITY:
+            return None
+        if self._simple_sentiment_analysis(pair["review"])["sentiment"] != sentiment:
+            return None
+
+        # 마지막 문장을 다른 마무리 문장으로 교체
+        # 마무리 문장만 바뀌므로 원본 답글과의 유사도는 중복 기준(0.8) 근처가 되어 원본은 중복 비교에서 제외
+        # (원본을 변형해 이미 게시한 다른 답글과는 그대로 비교)
+        sentences = re.split(r'(?<=[.!?])\s+', pair["reply"].strip())
+        closings = self.CLOSING_SENTENCES.get(sentiment, self.CLOSING_SENTENCES["neutral"])
+        candidates = [c for c in closings if c != sentences[-1]]
+        body = sentences[:-1] if len(sentences) > 1 else sentences
+
+        for closing in random.sample(candidates, len(candidates)):
+            adapted = " ".join(body + [closing])
+            if not self._is_duplicate(adapted, source=pair["reply"]):
+                return adapted
+        return None
+
+    def _is_low_value_review(self, review_content: str, analysis_result: Dict) -> bool:
+        """저가치 리뷰 여부 (짧은 긍정 리뷰)"""
+        return (
+            analysis_result["sentiment"] == "positive"
+            and len(review_content.strip()) <= self.LOW_VALUE_MAX_LENGTH
+        )
+
+    def _simple_sentiment_analysis(self, review_content: str) -> Dict:
+        """간단한 감정 분석 (OpenAI API 없이 사용할 경우)"""
+        return simple_sentiment_analysis(review_content)
+
     def _get_system_prompt(self, sentiment: str) -> str:
         """감정별 시스템 프롬프트"""
         prompts = {
@@ -157,7 +459,8 @@ class AIReplyGenerator:
         self,
         review_content: str,
         analysis_result: Dict,
-        brand_context: str
+        brand_context: str,
+        examples: list = None
     ) -> str:
         """고도화 프롬프트 구성"""
 
@@ -196,35 +499,52 @@ class AIReplyGenerator:
 
 답글만 작성하세요 (부가 설명 없이):"""
 
+        # 비슷한 리뷰에 게시했던 답글 예시 (표현 복사 방지 안내 포함)
+        if examples:
+            example_lines = "\n".join(
+                f"- 리뷰: {pair['review'][:60]}\n  답글: {pair['reply']}" for pair in examples
+            )
+            prompt = prompt.replace(
+                "답글만 작성하세요",
+                f"[비슷한 리뷰에 작성했던 답글 예시 (톤만 참고, 문장 복사 금지)]\n{example_lines}\n\n답글만 작성하세요"
+            )
+
         return prompt
 
-    def _validate_and_adjust_reply(
+    def _build_compact_user_prompt(
         self,
-        reply: str,
+        review_content: str,
         analysis_result: Dict
     ) -> str:
-        """답글 검증 및 후처리"""
-
-        # 따옴표 제거
-        reply = reply.strip('"\'')
-
-        # 길이 체크
-        if len(reply) < 40:
-            # 너무 짧으면 템플릿으로 대체
-            return self._generate_template_reply(
-                analysis_result["sentiment"],
-                analysis_result.get("topics", []),
-                analysis_result.get("keywords", [])
-            )
+        """예산 압박 시 사용하는 축약 프롬프트"""
 
-        # 길이가 너무 길면 잘라내기
-        if len(reply) > 150:
-            sentences = reply.split('.')
-            reply = '. '.join(sentences[:2]) + '.'
-            if len(reply) > 150:
-                reply = reply[:147] + '...'
+        keywords = ", ".join(analysis_result.get("keywords", []))
 
-        return reply
+        return f"""리뷰: "{review_content}"
+키워드: {keywords or "없음"}
+고객 키워드 1개를 넣어 80-120자, 2-3문장, 이모지 1-2개로 답글만 작성하세요:"""
+
+    def _validate_and_adjust_reply(
+        self,
+        reply: str,
+        analysis_result: Dict
+    ) -> Tuple[str, Dict]:
+        """답글 검증 및 후처리 (따옴표/머리말 제거, 이모지 개수 맞추기, 문장 단위 줄이기)
+
+        반환: (답글, 검증 결과) - 검증 결과의 passed가 False면 재생성 필요
+        """
+        keywords = analysis_result.get("keywords", [])
+        reply = self.validator.clean(reply)
+        report = self.validator.validate(reply, keywords)
+        if report["passed"]:
+            return reply, report
+
+        # 이모지가 없으면 감정에 맞는 이모지 추가 (부정 리뷰에는 웃는 얼굴 대신 사과 표현)
+        fill_emoji = "🙏" if analysis_result.get("sentiment") == "negative" else None
+        fixed_reply, report = self.validator.fix(reply, report, keywords, fill_emoji)
+        if report["passed"]:
+            self.validation_stats["fixed"] += 1
+        return fixed_reply, report
 
     def _generate_template_reply(
         self,
@@ -233,6 +553,15 @@ class AIReplyGenerator:
         keywords: list
     ) -> str:
         """템플릿 기반 폴백 답글"""
+        return random.choice(self._template_candidates(sentiment, topics, keywords))
+
+    def _template_candidates(
+        self,
+        sentiment: str,
+        topics: list,
+        keywords: list
+    ) -> list:
+        """감정별 템플릿 답글 후보 목록"""
 
         templates = {
             "positive": [
@@ -240,17 +569,21 @@ class AIReplyGenerator:
                 f"{keywords[0] if keywords else '서비스'} 만족스러우셨다니 기쁩니다! 항상 최선을 다하는 저희 매장이 되겠습니다. 다음에 또 뵙겠습니다 😊"
             ],
             "negative": [
-                f"불편을 드려 정말 죄송합니다. {topics[0] if topics else '서비스'} 관련하여 즉시 개선하겠습니다. 더 나은 모습으로 다시 찾아뵙고 싶습니다.",
-                f"소중한 의견 감사합니다. 말씀하신 {keywords[0] if keywords else '부분'}은 빠르게 개선하도록 하겠습니다. 다시 한번 사과드립니다."
+                f"불편을 드려 정말 죄송합니다 🙏 {topics[0] if topics else '서비스'} 관련하여 즉시 개선하겠습니다. 더 나은 모습으로 다시 찾아뵙고 싶습니다.",
+                f"소중한 의견 감사합니다. 말씀하신 {keywords[0] if keywords else '부분'}은 빠르게 개선하도록 하겠습니다. 다시 한번 사과드립니다 🙏"
             ],
             "neutral": [
                 "방문해 주셔서 감사합니다 😊 소중한 의견 잘 참고하여 더 나은 서비스로 보답하겠습니다!",
-                "피드백 감사드립니다. 고객님의 의견을 바탕으로 지속적으로 개선해 나가겠습니다!"
+                "피드백 감사드립니다 😊 고객님의 의견을 바탕으로 지속적으로 개선해 나가겠습니다!"
+            ],
+            # 텍스트 없이 사진만 남긴 리뷰
+            "photo": [
+                "멋진 사진과 함께 리뷰 남겨주셔서 감사합니다 😊 다음 방문도 즐거운 시간이 되도록 준비하겠습니다!",
+                "소중한 사진 리뷰 감사드립니다! 보내주신 관심에 보답할 수 있도록 항상 최선을 다하겠습니다 😊"
             ]
         }
 
-        template_list = templates.get(sentiment, templates["neutral"])
-        return random.choice(template_list)
+        return templates.get(sentiment, templates["neutral"])
 
 
 # 간단한 사용 예제
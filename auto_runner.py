@@ -0,0 +1,79 @@
+"""
+자동 답글 프로그램 인프로세스 실행기
+naverplace-auto-login.py를 별도 인터프리터 없이 작업 스레드에서 실행하고
+진행 상황 이벤트를 큐로 전달
+"""
+
+import importlib.util
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+
+
+SCRIPT_NAME = "naverplace-auto-login.py"
+
+
+def _script_path() -> str:
+    """자동화 스크립트 경로 (PyInstaller 번들이면 압축 해제 경로 기준)"""
+    base_dir = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, SCRIPT_NAME)
+
+
+def load_automation_module():
+    """자동화 스크립트를 모듈로 로드 (실행할 때마다 새로 로드하여 최신 설정 반영)"""
+    spec = importlib.util.spec_from_file_location("naverplace_auto_login", _script_path())
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class AutoReplyRunner:
+    """작업 스레드에서 자동 답글 실행
+
+    이벤트는 dict 형태로 events 큐에 전달됨:
+    - phase: 현재 단계 (phase)
+    - progress: 처리 현황 (done, remaining, replied, replies_per_minute)
+    - reply: 등록된 답글 (review, reply)
+    - error: 오류 메시지 (message)
+    - finished: 실행 종료 (cancelled)
+    """
+
+    def __init__(self):
+        self.events = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        """실행 시작"""
+        if self.is_running():
+            return
+        self.cancel_event.clear()
+        self.thread = threading.Thread(target=self._run, name="AutoReplyRunner", daemon=True)
+        self.thread.start()
+
+    def cancel(self):
+        """취소 요청 (진행 중인 리뷰가 끝난 뒤 중단)"""
+        self.cancel_event.set()
+
+    def is_running(self) -> bool:
+        """실행 중 여부"""
+        return self.thread is not None and self.thread.is_alive()
+
+    def _put(self, event_type: str, **data):
+        self.events.put({"type": event_type, "time": time.time(), **data})
+
+    def _run(self):
+        try:
+            module = load_automation_module()
+            module.main(events=self.events, cancel=self.cancel_event)
+        except SystemExit:
+            # 스크립트의 설정 로드 실패 시 sys.exit() 호출
+            self._put("error", message="설정 파일을 확인해주세요. 프로그램을 시작할 수 없습니다.")
+        except Exception as e:
+            traceback.print_exc()
+            self._put("error", message=f"프로그램 실행 실패: {e}")
+        finally:
+            self._put("finished", cancelled=self.cancel_event.is_set())
@@ -0,0 +1,272 @@
+"""
+답글 엔진 CPU 단계 벤치마크
+합성 리뷰 코퍼스로 감정 분석, 프롬프트 구성, 답글 검증, 템플릿 답글 단계의
+처리량(건/초), 메모리(최대 할당량), 정확도를 측정하고 기준값 대비 회귀를 검사
+
+기준값:
+    benchmark_accuracy.json  정확도 (시드 고정 코퍼스라 어느 PC에서나 같음, 저장소에 포함)
+    benchmark_baseline.json  처리량 (PC마다 달라 로컬에만 저장)
+
+사용 예:
+    python benchmark_reply_engine.py --save-baseline   # 이 PC의 처리량 기준값 저장
+    python benchmark_reply_engine.py --save-accuracy   # 정확도 기준값 갱신 (의도한 변경일 때만, 함께 커밋)
+    python benchmark_reply_engine.py --check           # 기준값 대비 회귀 시 종료 코드 1
+"""
+
+from typing import Callable, Dict, List
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from ai_reply_generator import AIReplyGenerator
+from review_corpus import generate_corpus
+
+
+BASELINE_FILE = "benchmark_baseline.json"
+ACCURACY_FILE = "benchmark_accuracy.json"
+
+# 감정별 템플릿 답글에 있어야 하는 표현 (하나 이상)
+TEMPLATE_MARKERS = {
+    "positive": ["감사", "기쁩"],
+    "negative": ["죄송", "사과"],
+    "neutral": ["감사"],
+}
+
+
+def build_reply_samples(corpus: List[Dict], seed: int) -> List[str]:
+    """답글 검증 단계 입력: 따옴표, 너무 짧은/긴 답글, '!'/'요'로 끝나는 문장 등 다양한 생성 결과 모사"""
+    rng = random.Random(seed)
+    samples = []
+    for review in corpus:
+        sentences = rng.randint(1, 6)
+        parts = [rng.choice([
+            "방문해 주셔서 감사합니다!",
+            "말씀해 주신 부분은 꼭 개선하겠습니다.",
+            "불편을 드려 정말 죄송합니다",
+            f"'{review['text'][:15]}' 말씀 잘 새겨듣겠습니다 😊",
+            "다음에도 좋은 시간 보내실 수 있도록 노력할게요",
+            "항상 최선을 다하는 매장이 되겠습니다!",
+        ]) for _ in range(sentences)]
+        reply = " ".join(parts)
+        if rng.random() < 0.2:
+            reply = f'"{reply}"'
+        samples.append(reply)
+    return samples
+
+
+def _run_stage(fn: Callable, inputs: List, repeat: int, memory_sample: int) -> Dict:
+    """단계 실행: 반복 중 최고 처리량과 표본 구간의 최대 메모리 할당량 측정"""
+    best_seconds = None
+    outputs = None
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        outputs = [fn(item) for item in inputs]
+        seconds = time.perf_counter() - started_at
+        best_seconds = seconds if best_seconds is None else min(best_seconds, seconds)
+
+    # tracemalloc은 실행 속도를 떨어뜨리므로 표본에서만 별도로 측정
+    tracemalloc.start()
+    _ = [fn(item) for item in inputs[:memory_sample]]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "items": len(inputs),
+        "seconds": best_seconds,
+        "throughput": len(inputs) / best_seconds if best_seconds else 0.0,
+        "peak_kb": peak / 1024,
+        "outputs": outputs,
+    }
+
+
+def run_benchmarks(size: int, seed: int, repeat: int, memory_sample: int) -> Dict:
+    """전체 단계 벤치마크 실행"""
+    print(f"코퍼스 생성 중... ({size:,}개, seed={seed})")
+    corpus = generate_corpus(size, seed)
+    texts = [review["text"] for review in corpus]
+    labels = [review["label"] for review in corpus]
+
+    # API 호출은 하지 않으므로 임의의 키로 생성
+    generator = AIReplyGenerator("benchmark")
+    results = {}
+
+    # 1. 감정 분석
+    stage = _run_stage(generator._simple_sentiment_analysis, texts, repeat, memory_sample)
+    analyses = stage.pop("outputs")
+    stage["accuracy"] = sum(a["sentiment"] == l for a, l in zip(analyses, labels)) / size
+    for subset in ("negated", "mixed", "has_emoji"):
+        indices = [i for i, review in enumerate(corpus) if review[subset]]
+        if indices:
+            stage[f"accuracy_{subset}"] = (
+                sum(analyses[i]["sentiment"] == labels[i] for i in indices) / len(indices)
+            )
+    results["sentiment"] = stage
+
+    # 2. 프롬프트 구성 (리뷰 원문과 분석 결과가 모두 들어갔는지 확인)
+    pairs = list(zip(texts, analyses))
+    stage = _run_stage(
+        lambda pair: generator._build_user_prompt(pair[0], pair[1], "카페"),
+        pairs, repeat, memory_sample
+    )
+    prompts = stage.pop("outputs")
+    stage["accuracy"] = sum(
+        text in prompt and analysis["sentiment"] in prompt
+        for (text, analysis), prompt in zip(pairs, prompts)
+    ) / size
+    results["prompt"] = stage
+
+    # 3. 답글 검증 (로컬 수정 후 작성 규칙을 모두 충족하는 비율)
+    samples = build_reply_samples(corpus, seed)
+    validate_inputs = list(zip(samples, analyses))
+    stage = _run_stage(
+        lambda pair: generator._validate_and_adjust_reply(pair[0], pair[1]),
+        validate_inputs, repeat, memory_sample
+    )
+    validated = stage.pop("outputs")
+    stage["accuracy"] = sum(report["passed"] for _, report in validated) / size
+    results["validator"] = stage
+
+    # 4. 템플릿 답글 (감정에 맞는 표현 포함 비율)
+    stage = _run_stage(
+        lambda label: generator._generate_template_reply(label, [], []),
+        labels, repeat, memory_sample
+    )
+    templates = stage.pop("outputs")
+    stage["accuracy"] = sum(
+        any(marker in reply for marker in TEMPLATE_MARKERS[label])
+        for reply, label in zip(templates, labels)
+    ) / size
+    results["template"] = stage
+
+    return results
+
+
+def print_results(results: Dict):
+    print(f"\n{'단계':<12}{'건수':>10}{'처리량(건/초)':>16}{'메모리(KB)':>14}{'정확도':>10}")
+    print("-" * 62)
+    for name, stage in results.items():
+        print(f"{name:<12}{stage['items']:>10,}{stage['throughput']:>16,.0f}"
+              f"{stage['peak_kb']:>14,.1f}{stage['accuracy']:>10.4f}")
+        for key, value in stage.items():
+            if key.startswith("accuracy_"):
+                print(f"{'':<12}  - {key}: {value:.4f}")
+
+
+def accuracy_metrics(results: Dict) -> Dict[str, Dict[str, float]]:
+    """단계별 정확도 항목 (accuracy, accuracy_*)"""
+    return {
+        name: {key: value for key, value in stage.items() if key.startswith("accuracy")}
+        for name, stage in results.items()
+    }
+
+
+def check_throughput(results: Dict, baseline: Dict, speed_tolerance: float) -> List[str]:
+    """처리량 회귀 목록 (허용 비율 이상 감소)"""
+    failures = []
+    for name, base in baseline.get("stages", {}).items():
+        current = results.get(name)
+        if current is None:
+            failures.append(f"{name}: 단계가 측정되지 않았습니다.")
+            continue
+        min_throughput = base["throughput"] * (1 - speed_tolerance)
+        if current["throughput"] < min_throughput:
+            failures.append(
+                f"{name}: 처리량 {current['throughput']:,.0f}건/초 < 기준 {base['throughput']:,.0f}건/초 "
+                f"(허용 -{speed_tolerance:.0%})"
+            )
+    return failures
+
+
+def check_accuracy(results: Dict, baseline: Dict, accuracy_tolerance: float) -> List[str]:
+    """정확도 회귀 목록 (허용치 이상 하락)"""
+    failures = []
+    current_metrics = accuracy_metrics(results)
+    for name, base_metrics in baseline.get("stages", {}).items():
+        current = current_metrics.get(name)
+        if current is None:
+            failures.append(f"{name}: 단계가 측정되지 않았습니다.")
+            continue
+        for key, base_value in base_metrics.items():
+            value = current.get(key)
+            if value is None or value < base_value - accuracy_tolerance:
+                failures.append(
+                    f"{name}: {key} {value if value is None else f'{value:.4f}'} < 기준 {base_value:.4f} "
+                    f"(허용 -{accuracy_tolerance})"
+                )
+    return failures
+
+
+def _load_json(path: str):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="답글 엔진 CPU 단계 벤치마크")
+    parser.add_argument("--size", type=int, default=100_000, help="코퍼스 크기 (기본 100,000)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (기본 42)")
+    parser.add_argument("--repeat", type=int, default=3, help="단계별 반복 횟수, 최고 기록 사용 (기본 3)")
+    parser.add_argument("--memory-sample", type=int, default=5_000, help="메모리 측정 표본 수 (기본 5,000)")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help=f"처리량 기준값 파일 (기본 {BASELINE_FILE})")
+    parser.add_argument("--accuracy-baseline", default=ACCURACY_FILE, help=f"정확도 기준값 파일 (기본 {ACCURACY_FILE})")
+    parser.add_argument("--save-baseline", action="store_true", help="처리량을 기준값으로 저장")
+    parser.add_argument("--save-accuracy", action="store_true", help="정확도를 기준값으로 저장")
+    parser.add_argument("--check", action="store_true", help="기준값 대비 회귀 시 종료 코드 1")
+    parser.add_argument("--speed-tolerance", type=float, default=0.2, help="허용 처리량 감소 비율 (기본 0.2)")
+    parser.add_argument("--accuracy-tolerance", type=float, default=0.005, help="허용 정확도 하락 (기본 0.005)")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.size, args.seed, args.repeat, args.memory_sample)
+    print_results(results)
+
+    if args.save_baseline:
+        stages = {name: {key: stage[key] for key in ("items", "seconds", "throughput", "peak_kb")}
+                  for name, stage in results.items()}
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({"size": args.size, "seed": args.seed, "stages": stages}, f, ensure_ascii=False, indent=2)
+        print(f"\n처리량 기준값을 {args.baseline}에 저장했습니다.")
+
+    if args.save_accuracy:
+        with open(args.accuracy_baseline, 'w', encoding='utf-8') as f:
+            json.dump({"size": args.size, "seed": args.seed, "stages": accuracy_metrics(results)},
+                      f, ensure_ascii=False, indent=2)
+        print(f"\n정확도 기준값을 {args.accuracy_baseline}에 저장했습니다.")
+
+    if args.check:
+        # 정확도 기준값은 저장소에 포함되므로 없거나 코퍼스가 다르면 검사 실패
+        accuracy_baseline = _load_json(args.accuracy_baseline)
+        if accuracy_baseline is None:
+            print(f"\n정확도 기준값 파일 {args.accuracy_baseline}이 없습니다.")
+            return 1
+        if (accuracy_baseline.get("size"), accuracy_baseline.get("seed")) != (args.size, args.seed):
+            print(f"\n정확도 기준값의 코퍼스(size={accuracy_baseline.get('size')}, seed={accuracy_baseline.get('seed')})와 "
+                  f"실행 코퍼스(size={args.size}, seed={args.seed})가 다릅니다.")
+            return 1
+        failures = check_accuracy(results, accuracy_baseline, args.accuracy_tolerance)
+
+        # 처리량 기준값은 PC별 로컬 파일 (없으면 처리량은 검사하지 않음)
+        baseline = _load_json(args.baseline)
+        if baseline is None:
+            print(f"\n처리량 기준값 파일 {args.baseline}이 없어 처리량은 검사하지 않습니다. "
+                  f"(--save-baseline으로 이 PC의 기준값 저장)")
+        else:
+            failures += check_throughput(results, baseline, args.speed_tolerance)
+
+        if failures:
+            print("\n회귀 감지:")
+            for failure in failures:
+                print(f"  - {failure}")
+            return 1
+        print("\n회귀 없음")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import queue
 import json
 import os
+from auto_runner import AutoReplyRunner
 
 class ConfigGUI:
     def __init__(self, root):
@@ -182,18 +184,20 @@ class ConfigGUI:
                 self.api_key_entry.focus()
                 return False
 
-        # 설정 저장
-        config_data = {
+        # 설정 저장 (GUI에 없는 항목(예산 등)은 기존 값 유지)
+        config_data = dict(self.config)
+        config_data.update({
             "naver_id": naver_id,
             "naver_pw": naver_pw,
             "business_name": business_name,
             "openai_api_key": openai_api_key
-        }
+        })
 
         try:
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(config_data, f, ensure_ascii=False, indent=2)
 
+            self.config = config_data
             self.status_label.config(text="✓ 설정이 저장되었습니다.", foreground="green")
             return True
 
@@ -209,11 +213,125 @@ class ConfigGUI:
             self.root.after(1000, self.run_main_program)
 
     def run_main_program(self):
-        """메인 프로그램 실행"""
-        self.root.destroy()
-        # 여기서 메인 자동화 스크립트를 실행
-        import subprocess
-        subprocess.Popen(["python", "naverplace-auto-login.py"])
+        """메인 프로그램 실행 (작업 스레드에서 실행, 진행 상황 창 표시)"""
+        runner = AutoReplyRunner()
+        runner.start()
+        self.root.withdraw()
+        ProgressWindow(self.root, runner)
+
+class ProgressWindow:
+    """자동 답글 실행 진행 상황 창"""
+
+    # 이벤트 큐 확인 주기 (ms)
+    POLL_INTERVAL = 200
+
+    def __init__(self, root, runner):
+        self.root = root
+        self.runner = runner
+        self.finished = False
+
+        self.window = tk.Toplevel(root)
+        self.window.title("네이버 플레이스 자동 답글 - 실행 중")
+        self.window.geometry("500x420")
+        self.window.resizable(False, False)
+        self.window.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        self.create_widgets()
+        self.window.after(self.POLL_INTERVAL, self.poll_events)
+
+    def create_widgets(self):
+        """UI 위젯 생성"""
+        main_frame = ttk.Frame(self.window, padding="20")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # 현재 단계
+        self.phase_label = ttk.Label(main_frame, text="단계: 준비 중",
+                                     font=("맑은 고딕", 12, "bold"))
+        self.phase_label.pack(anchor=tk.W)
+
+        # 진행률
+        self.progress_bar = ttk.Progressbar(main_frame, mode="determinate", length=460)
+        self.progress_bar.pack(fill=tk.X, pady=(10, 5))
+
+        self.count_label = ttk.Label(main_frame, text="처리 0개 / 남음 -개 · 분당 답글 0.0개",
+                                     font=("맑은 고딕", 10))
+        self.count_label.pack(anchor=tk.W)
+
+        # 마지막 답글
+        ttk.Label(main_frame, text="마지막 답글:", font=("맑은 고딕", 10, "bold")).pack(
+            anchor=tk.W, pady=(15, 0)
+        )
+        self.last_reply_label = ttk.Label(main_frame, text="-", wraplength=460,
+                                          font=("맑은 고딕", 9))
+        self.last_reply_label.pack(anchor=tk.W)
+
+        # 오류 목록
+        ttk.Label(main_frame, text="오류:", font=("맑은 고딕", 10, "bold")).pack(
+            anchor=tk.W, pady=(15, 0)
+        )
+        self.error_list = tk.Listbox(main_frame, height=5, font=("맑은 고딕", 9))
+        self.error_list.pack(fill=tk.X)
+
+        # 취소/닫기 버튼
+        self.cancel_btn = ttk.Button(main_frame, text="취소", command=self.on_cancel, width=15)
+        self.cancel_btn.pack(pady=(15, 0))
+
+    def poll_events(self):
+        """이벤트 큐 확인 후 화면 갱신 (Tk 메인 스레드에서만 위젯 접근)"""
+        try:
+            while True:
+                self.handle_event(self.runner.events.get_nowait())
+        except queue.Empty:
+            pass
+
+        if not self.finished:
+            self.window.after(self.POLL_INTERVAL, self.poll_events)
+
+    def handle_event(self, event):
+        """이벤트 종류별 화면 갱신"""
+        event_type = event["type"]
+
+        if event_type == "phase":
+            self.phase_label.config(text=f"단계: {event['phase']}")
+
+        elif event_type == "progress":
+            total = event["done"] + event["remaining"]
+            self.progress_bar.config(maximum=max(total, 1), value=event["done"])
+            self.count_label.config(
+                text=f"처리 {event['done']}개 / 남음 {event['remaining']}개 · "
+                     f"등록 {event['replied']}개 · 분당 답글 {event['replies_per_minute']:.1f}개"
+            )
+
+        elif event_type == "reply":
+            self.last_reply_label.config(text=event["reply"])
+
+        elif event_type == "error":
+            self.error_list.insert(tk.END, event["message"])
+            self.error_list.see(tk.END)
+
+        elif event_type == "finished":
+            self.finished = True
+            self.window.title("네이버 플레이스 자동 답글 - 종료")
+            self.phase_label.config(text="단계: 취소됨" if event["cancelled"] else "단계: 완료")
+            self.cancel_btn.config(text="닫기", command=self.close, state=tk.NORMAL)
+
+    def on_cancel(self):
+        """취소 요청 (진행 중인 리뷰가 끝난 뒤 중단)"""
+        self.runner.cancel()
+        self.phase_label.config(text="단계: 취소 중 (현재 리뷰 처리 후 중단)")
+        self.cancel_btn.config(state=tk.DISABLED)
+
+    def on_close(self):
+        """창 닫기 버튼 처리"""
+        if self.finished:
+            self.close()
+        elif messagebox.askyesno("실행 중", "실행을 취소하시겠습니까?", parent=self.window):
+            self.on_cancel()
+
+    def close(self):
+        """진행 창을 닫고 설정 창으로 복귀"""
+        self.window.destroy()
+        self.root.deiconify()
 
 def main():
     root = tk.Tk()
@@ -0,0 +1,133 @@
+"""
+실패 시 디버그 스냅샷
+실행 중에는 단계 기록(브레드크럼)만 메모리 링 버퍼에 남기고,
+단계가 실패하거나 추적 모드일 때만 압축 HTML, 스크린샷, 단계 기록을 디스크에 저장 (보관 개수/용량 제한)
+"""
+
+from typing import Dict, List, Optional
+from collections import deque
+import gzip
+import json
+import logging
+import os
+import re
+import shutil
+import time
+
+logger = logging.getLogger(__name__)
+
+
+# 스냅샷에 함께 저장할 페이지 요약 (WebDriver 왕복 1회)
+PAGE_SUMMARY_SCRIPT = """
+return {
+    url: location.href,
+    title: document.title,
+    iframes: Array.from(document.querySelectorAll('iframe')).map(f => ({
+        id: f.id || null, name: f.name || null, src: (f.src || '').slice(0, 100)
+    }))
+};
+"""
+
+
+class DebugRecorder:
+    """단계 기록 링 버퍼 및 스냅샷 저장소
+
+    스냅샷은 snapshot_dir/<시각>-<사유>/ 폴더에 page.html.gz, screenshot.png, meta.json으로 저장
+    """
+
+    def __init__(
+        self,
+        snapshot_dir: str = "debug_snapshots",
+        ring_size: int = 50,
+        trace: bool = False,
+        max_snapshots: int = 20,
+        max_total_mb: float = 50
+    ):
+        self.snapshot_dir = snapshot_dir
+        self.breadcrumbs = deque(maxlen=ring_size)
+        self.trace = trace
+        self.max_snapshots = max_snapshots
+        self.max_total_bytes = int(max_total_mb * 1024 * 1024)
+        self.started_at = time.time()
+
+    def breadcrumb(self, step: str, **data):
+        """단계 기록 추가 (드라이버 호출 없이 메모리에만 기록)"""
+        self.breadcrumbs.append({
+            "time": time.strftime("%H:%M:%S"),
+            "elapsed": round(time.time() - self.started_at, 2),
+            "step": step,
+            **data
+        })
+
+    def trace_point(self, driver, step: str) -> Optional[str]:
+        """추적 모드일 때만 스냅샷 저장"""
+        self.breadcrumb(step)
+        if not self.trace:
+            return None
+        return self.capture(driver, step)
+
+    def capture(self, driver, reason: str) -> Optional[str]:
+        """스냅샷 저장 후 폴더 경로 반환 (저장 실패는 실행을 막지 않음)"""
+        if driver is None:
+            return None
+
+        slug = re.sub(r'[^\w-]+', '_', reason).strip("_")[:40] or "snapshot"
+        base_path = os.path.join(self.snapshot_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{slug}")
+        path = base_path
+        suffix = 1
+        while os.path.exists(path):
+            suffix += 1
+            path = f"{base_path}-{suffix}"
+
+        meta = {"reason": reason, "captured_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "breadcrumbs": list(self.breadcrumbs)}
+        try:
+            os.makedirs(path, exist_ok=True)
+            try:
+                meta["page"] = driver.execute_script(PAGE_SUMMARY_SCRIPT)
+            except Exception as e:
+                meta["page_error"] = str(e)
+            try:
+                with gzip.open(os.path.join(path, "page.html.gz"), "wt", encoding="utf-8") as f:
+                    f.write(driver.page_source)
+            except Exception as e:
+                meta["html_error"] = str(e)
+            try:
+                driver.save_screenshot(os.path.join(path, "screenshot.png"))
+            except Exception as e:
+                meta["screenshot_error"] = str(e)
+            with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            logger.warning("디버그 스냅샷 저장 실패: %s", e)
+            return None
+
+        logger.info("디버그 스냅샷 저장: %s", path)
+        self._enforce_retention()
+        return path
+
+    def _snapshots(self) -> List[Dict]:
+        """저장된 스냅샷 목록 (오래된 순)"""
+        if not os.path.isdir(self.snapshot_dir):
+            return []
+        snapshots = []
+        for name in os.listdir(self.snapshot_dir):
+            path = os.path.join(self.snapshot_dir, name)
+            if not os.path.isdir(path):
+                continue
+            size = sum(
+                os.path.getsize(os.path.join(path, file_name))
+                for file_name in os.listdir(path)
+                if os.path.isfile(os.path.join(path, file_name))
+            )
+            snapshots.append({"path": path, "size": size, "mtime": os.path.getmtime(path)})
+        return sorted(snapshots, key=lambda snapshot: snapshot["mtime"])
+
+    def _enforce_retention(self):
+        """보관 개수/용량을 넘으면 오래된 스냅샷부터 삭제 (가장 최근 스냅샷은 유지)"""
+        snapshots = self._snapshots()
+        total = sum(s["size"] for s in snapshots)
+        while len(snapshots) > 1 and (len(snapshots) > self.max_snapshots or total > self.max_total_bytes):
+            oldest = snapshots.pop(0)
+            shutil.rmtree(oldest["path"], ignore_errors=True)
+            total -= oldest["size"]
@@ -0,0 +1,220 @@
+"""
+브라우저 드라이버 감시 및 재시작
+브라우저 메모리와 단계별 소요 시간을 측정하고, 한도를 넘으면 리뷰 사이의 안전한 시점에
+드라이버를 재시작 (종료 → 새로 실행 → 세션 복원 → 리뷰 페이지로 복귀)
+단계가 한도 안에 끝나지 않고 멈춰 있으면 감시 타이머가 드라이버를 종료해 멈춘 명령을 끝냄
+"""
+
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+import contextlib
+import logging
+import threading
+import time
+
+try:
+    import psutil
+except ImportError:
+    # psutil이 없으면 브라우저 프로세스 RSS 대신 페이지 JS 힙 크기로 측정
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+class DriverSupervisor:
+    """드라이버 감시기
+
+    launch(): 새 드라이버 생성
+    relogin(driver): 로그인부터 리뷰 페이지까지 이동, 성공 시 True
+    is_ready(driver): 리뷰 목록이 표시되었는지 확인
+    """
+
+    def __init__(
+        self,
+        launch: Callable,
+        relogin: Callable,
+        is_ready: Callable,
+        max_memory_mb: float = 1500,
+        max_step_seconds: float = 180,
+        recycle_every: int = 0,
+        page_load_timeout: float = 60
+    ):
+        self.launch = launch
+        self.relogin = relogin
+        self.is_ready = is_ready
+        self.max_memory_bytes = int(max_memory_mb * MB) if max_memory_mb else None
+        self.max_step_seconds = max_step_seconds or None
+        self.recycle_every = recycle_every or None
+        self.page_load_timeout = page_load_timeout
+
+        self.driver = None
+        self.recycles = 0
+        self.recycle_reasons: List[str] = []
+        self.peak_memory = 0
+        self.memory_source = None
+        self.slowest_step = {"name": None, "seconds": 0.0}
+        self.steps_since_recycle = 0
+        self._pending_reason: Optional[str] = None
+
+    def start(self):
+        """드라이버 실행"""
+        self.driver = self.launch()
+        # 렌더러가 멈춰도 페이지 이동 명령이 무한정 기다리지 않도록 제한
+        self.driver.set_page_load_timeout(self.page_load_timeout)
+        self.steps_since_recycle = 0
+        self._pending_reason = None
+        return self.driver
+
+    def quit(self):
+        """드라이버 종료 (이미 응답이 없어도 진행)"""
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.warning("드라이버 종료 중 오류: %s", e)
+        self.driver = None
+
+    @contextlib.contextmanager
+    def step(self, name: str):
+        """단계 소요 시간 측정 (한도를 넘으면 다음 안전 지점에서 재시작)
+
+        단계가 한도 시간 안에 끝나지 않으면 감시 타이머가 드라이버를 종료하므로
+        멈춘 드라이버 명령은 예외로 끝나고, 다음 안전 지점에서 새 드라이버로 재시작
+        """
+        started_at = time.perf_counter()
+        watchdog = None
+        if self.max_step_seconds:
+            watchdog = threading.Timer(self.max_step_seconds, self._abort_step, args=(name,))
+            watchdog.daemon = True
+            watchdog.start()
+        try:
+            yield
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+            seconds = time.perf_counter() - started_at
+            self.steps_since_recycle += 1
+            if seconds > self.slowest_step["seconds"]:
+                self.slowest_step = {"name": name, "seconds": round(seconds, 2)}
+            if self.max_step_seconds and seconds > self.max_step_seconds:
+                self.request_recycle(f"단계 '{name}' {seconds:.0f}초 소요 (한도 {self.max_step_seconds:.0f}초)")
+
+    def _abort_step(self, name: str):
+        """감시 타이머: 한도 시간 안에 끝나지 않은 단계의 드라이버 종료"""
+        logger.error("단계 '%s'이(가) %.0f초 안에 끝나지 않아 브라우저를 종료합니다.", name, self.max_step_seconds)
+        self.request_recycle(f"단계 '{name}' {self.max_step_seconds:.0f}초 초과로 중단")
+        self.quit()
+
+    def request_recycle(self, reason: str):
+        """다음 안전 지점에서 재시작하도록 표시"""
+        if self._pending_reason is None:
+            self._pending_reason = reason
+
+    def is_responsive(self) -> bool:
+        """드라이버가 명령에 응답하는지 확인"""
+        try:
+            return self.driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    def sample_memory(self) -> Optional[int]:
+        """브라우저 메모리 (바이트): psutil이 있으면 chromedriver 하위 프로세스 RSS 합, 없으면 JS 힙"""
+        memory = None
+        if psutil is not None:
+            try:
+                process = psutil.Process(self.driver.service.process.pid)
+                memory = 0
+                for child in process.children(recursive=True):
+                    try:
+                        memory += child.memory_info().rss
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        continue
+                self.memory_source = "rss"
+            except Exception:
+                memory = None
+        if memory is None:
+            try:
+                self.driver.execute_cdp_cmd("Performance.enable", {})
+                metrics = self.driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+                memory = int(next(m["value"] for m in metrics if m["name"] == "JSHeapTotalSize"))
+                self.memory_source = "js_heap"
+            except Exception:
+                return None
+
+        self.peak_memory = max(self.peak_memory, memory)
+        return memory
+
+    def check(self) -> Optional[str]:
+        """안전 지점(리뷰 사이)에서 호출: 재시작이 필요하면 사유 반환"""
+        if self._pending_reason:
+            return self._pending_reason
+
+        memory = self.sample_memory()
+        if self.max_memory_bytes and memory is not None and memory > self.max_memory_bytes:
+            return f"브라우저 메모리 {memory / MB:.0f}MB (한도 {self.max_memory_bytes / MB:.0f}MB)"
+        if self.recycle_every and self.steps_since_recycle >= self.recycle_every:
+            return f"리뷰 {self.steps_since_recycle}건 처리 (주기 {self.recycle_every}건)"
+        return None
+
+    def recycle(self, reason: str) -> bool:
+        """드라이버 재시작 후 리뷰 페이지 복원, 성공 시 True"""
+        logger.warning("브라우저 재시작: %s", reason)
+        started_at = time.perf_counter()
+
+        # 종료 전에 현재 페이지와 쿠키 보관 (응답이 없으면 다시 로그인)
+        resume_url = None
+        cookies = []
+        if self.is_responsive():
+            try:
+                resume_url = self.driver.current_url
+                cookies = self.driver.get_cookies()
+            except Exception:
+                resume_url = None
+
+        self.quit()
+        self.start()
+        self.recycles += 1
+        self.recycle_reasons.append(reason)
+
+        restored = bool(resume_url and cookies) and self._restore_session(resume_url, cookies)
+        if not restored:
+            logger.info("세션 복원 실패, 다시 로그인합니다.")
+            restored = bool(self.relogin(self.driver)) and self.is_ready(self.driver)
+
+        logger.info("브라우저 재시작 %s (%.1f초)", "완료" if restored else "실패", time.perf_counter() - started_at)
+        return restored
+
+    def _restore_session(self, resume_url: str, cookies: List[Dict]) -> bool:
+        """보관한 쿠키로 로그인 세션 복원 후 이전 페이지로 이동"""
+        host = urlparse(resume_url).hostname or ""
+        try:
+            # 쿠키는 해당 도메인 페이지에서만 추가 가능
+            self.driver.get(f"{urlparse(resume_url).scheme}://{host}/")
+            for cookie in cookies:
+                domain = cookie.get("domain", "").lstrip(".")
+                if not (host == domain or host.endswith("." + domain)):
+                    continue
+                if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+                    cookie.pop("sameSite", None)
+                try:
+                    self.driver.add_cookie(cookie)
+                except Exception:
+                    continue
+            self.driver.get(resume_url)
+            return self.is_ready(self.driver)
+        except Exception as e:
+            logger.info("쿠키로 세션 복원 실패: %s", e)
+            return False
+
+    def report(self) -> Dict:
+        """재시작 횟수, 최대 메모리, 가장 오래 걸린 단계"""
+        return {
+            "recycles": self.recycles,
+            "recycle_reasons": list(self.recycle_reasons),
+            "peak_memory_mb": round(self.peak_memory / MB, 1),
+            "memory_source": self.memory_source,
+            "slowest_step": dict(self.slowest_step)
+        }
@@ -10,9 +10,23 @@ import pyperclip
 import time
 import random
 import json
+import logging
 import os
 import sys
-from ai_reply_generator import AIReplyGenerator
+from ai_reply_generator import AIReplyGenerator, simple_sentiment_analysis
+from usage_ledger import UsageLedger
+from reply_history_index import ReplyHistoryIndex
+from review_retrieval_index import ReviewRetrievalIndex
+from reply_backends import LocalHTTPBackend
+from reply_poster import ReplyPoster, PacingPolicy, STATE_SUBMITTED, STATE_RENDERED
+from reply_api_poster import ApiReplyPoster, RECORDING_FILE
+from review_scheduler import ReviewQueue, RunBudget, parse_review_date
+from run_logging import setup_logging, shutdown_logging, set_phase, log_context, timed
+from debug_snapshots import DebugRecorder
+from driver_supervisor import DriverSupervisor
+from review_precheck import PrecheckState, read_dashboard_count, newest_fingerprint
+
+logger = logging.getLogger("naverplace")
 
 # 설정 파일에서 계정 정보 로드
 def load_config():
@@ -20,8 +34,7 @@ def load_config():
     config_file = "config.json"
 
     if not os.path.exists(config_file):
-        print(f"오류: {config_file} 파일이 없습니다.")
-        print("먼저 config_gui.py를 실행하여 설정을 저장해주세요.")
+        logger.error("%s 파일이 없습니다. 먼저 config_gui.py를 실행하여 설정을 저장해주세요.", config_file)
         sys.exit(1)
 
     try:
@@ -32,16 +45,16 @@ def load_config():
         required_keys = ["naver_id", "naver_pw", "business_name"]
         for key in required_keys:
             if key not in config or not config[key]:
-                print(f"오류: {config_file}에 '{key}' 값이 없습니다.")
-                print("config_gui.py를 실행하여 올바른 설정을 저장해주세요.")
+                logger.error("%s에 '%s' 값이 없습니다. config_gui.py를 실행하여 올바른 설정을 저장해주세요.",
+                             config_file, key)
                 sys.exit(1)
 
         return config
     except json.JSONDecodeError as e:
-        print(f"오류: {config_file} 파일이 올바른 JSON 형식이 아닙니다: {e}")
+        logger.error("%s 파일이 올바른 JSON 형식이 아닙니다: %s", config_file, e)
         sys.exit(1)
     except Exception as e:
-        print(f"오류: 설정 파일 로드 실패: {e}")
+        logger.error("설정 파일 로드 실패: %s", e)
         sys.exit(1)
 
 # 설정 로드
@@ -51,19 +64,144 @@ NAVER_PW = config["naver_pw"]
 BUSINESS_NAME = config["business_name"]
 OPENAI_API_KEY = config.get("openai_api_key", "")
 
-print(f"설정 로드 완료: 업체명 = {BUSINESS_NAME}")
+# 로그 파이프라인 (콘솔 + logs/ 폴더 JSONL, --quiet 또는 log_quiet이면 콘솔에는 오류만 출력)
+RUN_ID = setup_logging(
+    business=BUSINESS_NAME,
+    log_dir=config.get("log_dir", "logs"),
+    console_level=config.get("log_level", "INFO"),
+    file_level=config.get("log_file_level", "INFO"),
+    module_levels=config.get("log_module_levels"),
+    quiet=bool(config.get("log_quiet", False)) or (__name__ == "__main__" and "--quiet" in sys.argv)
+)
+
+logger.info("설정 로드 완료: 업체명 = %s (실행 ID %s)", BUSINESS_NAME, RUN_ID)
+
+# 토큰/비용 사용량 장부 (예산 0이면 제한 없음)
+usage_ledger = UsageLedger(
+    daily_budget=float(config.get("daily_budget_usd", 0) or 0),
+    monthly_budget=float(config.get("monthly_budget_usd", 0) or 0)
+)
+
+# 업체별 게시 답글 이력 (중복 표현 답글 방지) 및 리뷰-답글 검색 인덱스 (유사 리뷰 답글 재사용)
+BUSINESS_FILE_NAME = "".join(c if c.isalnum() else "_" for c in BUSINESS_NAME)
+reply_history = ReplyHistoryIndex(os.path.join("reply_history", BUSINESS_FILE_NAME + ".npy"))
+review_index = ReviewRetrievalIndex(os.path.join("review_pairs", BUSINESS_FILE_NAME + ".jsonl"))
+
+class TextInput:
+    """드라이버 세션 단위 텍스트 입력
+
+    - cdp: Chrome DevTools Input.insertText로 포커스된 요소에 직접 삽입 (기본, 클립보드 미사용)
+    - keys: send_keys로 입력 (BMP 밖의 이모지는 ChromeDriver에서 입력되지 않음)
+    - clipboard: 시스템 클립보드 복사 후 Ctrl+V (프로세스 간 공유되므로 동시 실행 시 주의)
+    """
+
+    METHODS = ("cdp", "keys", "clipboard")
+
+    def __init__(self, method="cdp"):
+        if method not in self.METHODS:
+            logger.warning("알 수 없는 입력 방식 '%s', cdp 방식을 사용합니다.", method)
+            method = "cdp"
+        self.method = method
+
+    def insert(self, driver, element, text):
+        """요소에 텍스트 입력"""
+        element.click()
+        if self.method == "cdp":
+            driver.execute_cdp_cmd("Input.insertText", {"text": text})
+        elif self.method == "keys":
+            element.send_keys(text)
+        else:
+            pyperclip.copy(text)
+            element.send_keys(Keys.CONTROL, 'v')
+
+    @staticmethod
+    def read(driver, element):
+        """요소의 현재 입력 내용 (input/textarea는 value, contenteditable은 innerText)"""
+        return driver.execute_script(
+            "const e = arguments[0]; return 'value' in e ? e.value : e.innerText;", element
+        ) or ""
+
+    def matches(self, driver, element, text):
+        """입력 내용이 의도한 텍스트와 일치하는지 확인 (공백 차이 무시)"""
+        return " ".join(self.read(driver, element).split()) == " ".join(text.split())
+
+text_input = TextInput(config.get("input_method", "cdp"))
+
+# 답글 사이 대기 정책 (스크래핑 감지 방지, 기본 5~10초)
+pacing = PacingPolicy(
+    float(config.get("reply_delay_min", 5)),
+    float(config.get("reply_delay_max", 10))
+)
+
+# 새 리뷰 사전 확인 (할 일이 없는 실행은 리뷰 목록을 확인하기 전에 종료)
+PRECHECK_ENABLED = bool(config.get("precheck_enabled", True))
+PRECHECK_SIZE = int(config.get("precheck_fingerprint_size", 5))
+precheck_state = PrecheckState()
+
+# 단순 리뷰용 로컬 CPU 모델 (선택, 미설정 시 템플릿)
+local_backend = None
+if config.get("local_model_url"):
+    local_backend = LocalHTTPBackend(
+        config["local_model_url"],
+        model=config.get("local_model_name", "local"),
+        api_style=config.get("local_model_api", "openai")
+    )
 
 # AI 답글 생성기 초기화
 ai_generator = None
 if OPENAI_API_KEY:
     try:
-        ai_generator = AIReplyGenerator(OPENAI_API_KEY)
-        print("AI 답글 생성기 초기화 완료 (OpenAI API 사용)")
+        ai_generator = AIReplyGenerator(
+            OPENAI_API_KEY,
+            ledger=usage_ledger,
+            history_index=reply_history,
+            retrieval_index=review_index,
+            standard_model=config.get("standard_model", "gpt-4o-mini"),
+            strong_model=config.get("strong_model", "gpt-4o"),
+            local_backend=local_backend
+        )
+        logger.info("AI 답글 생성기 초기화 완료 (OpenAI API 사용)")
     except Exception as e:
-        print(f"AI 답글 생성기 초기화 실패: {e}")
-        print("템플릿 기반 답글을 사용합니다.")
+        logger.error("AI 답글 생성기 초기화 실패, 템플릿 기반 답글을 사용합니다: %s", e)
 else:
-    print("OpenAI API 키가 없습니다. 템플릿 기반 답글을 사용합니다.")
+    logger.warning("OpenAI API 키가 없습니다. 템플릿 기반 답글을 사용합니다.")
+
+# 단계 기록 및 실패 시 디버그 스냅샷 (debug_trace이면 주요 단계마다 스냅샷 저장)
+debug_recorder = DebugRecorder(
+    snapshot_dir=config.get("debug_snapshot_dir", "debug_snapshots"),
+    trace=bool(config.get("debug_trace", False)) or (__name__ == "__main__" and "--trace" in sys.argv),
+    max_snapshots=int(config.get("debug_max_snapshots", 20)),
+    max_total_mb=float(config.get("debug_max_mb", 50))
+)
+
+# GUI 러너에서 설정하는 진행 이벤트 큐 / 취소 이벤트 (단독 실행 시 None)
+progress_queue = None
+cancel_event = None
+# 실행 시작 시각 (사전 확인 판단 시간 기록용)
+run_started_at = time.perf_counter()
+
+def report_progress(event_type, **data):
+    """진행 상황 이벤트 전달 (GUI 러너가 없으면 무시)"""
+    if progress_queue is not None:
+        progress_queue.put({"type": event_type, "time": time.time(), **data})
+
+def report_phase(phase):
+    """현재 단계 기록 및 이벤트 전달"""
+    set_phase(phase)
+    debug_recorder.breadcrumb(phase)
+    logger.info("[단계] %s", phase)
+    report_progress("phase", phase=phase)
+
+def is_cancelled():
+    """취소 요청 여부"""
+    return cancel_event is not None and cancel_event.is_set()
+
+def wait_unless_cancelled(seconds):
+    """대기 (취소 요청 시 즉시 중단), 취소되었으면 True 반환"""
+    if cancel_event is None:
+        time.sleep(seconds)
+        return False
+    return cancel_event.wait(seconds)
 
 def setup_driver():
     """Chrome WebDriver 설정"""
@@ -86,43 +224,17 @@ def setup_driver():
 
     return driver
 
-def debug_page_structure(driver):
-    """페이지 구조 디버깅 - iframe 및 요소 확인"""
-    print("\n=== 페이지 구조 디버깅 ===")
-
-    # 현재 URL 확인
-    print(f"현재 URL: {driver.current_url}")
-
-    # 메인 프레임으로 이동
-    driver.switch_to.default_content()
-
-    # iframe 확인
-    iframes = driver.find_elements(By.TAG_NAME, "iframe")
-    print(f"\n발견된 iframe 개수: {len(iframes)}")
-    for i, iframe in enumerate(iframes):
-        iframe_id = iframe.get_attribute('id') or "없음"
-        iframe_name = iframe.get_attribute('name') or "없음"
-        iframe_src = (iframe.get_attribute('src') or "")[:100]
-        print(f"  iframe {i+1}: id={iframe_id}, name={iframe_name}, src={iframe_src}")
-
-    # HTML 저장
-    try:
-        with open('debug_page.html', 'w', encoding='utf-8') as f:
-            f.write(driver.page_source)
-        print("\n페이지 소스를 debug_page.html에 저장했습니다.")
-    except Exception as e:
-        print(f"HTML 저장 실패: {e}")
-
 def login_to_naver_place(driver):
-    """네이버 플레이스에 로그인"""
+    """네이버 플레이스에 로그인 후 업체 대시보드로 이동, 성공 시 True 반환"""
     try:
         # 1. 네이버 로그인 페이지로 직접 접속
-        print("네이버 로그인 페이지 접속 중...")
+        report_phase("로그인")
+        logger.info("네이버 로그인 페이지 접속 중...")
         driver.get("https://nid.naver.com/nidlogin.login")
         time.sleep(2)
 
         # 2. 네이버 로그인 페이지에서 로그인 처리
-        print("네이버 로그인 중...")
+        logger.info("네이버 로그인 중...")
         
         # 아이디 입력 필드 찾기
         id_input = WebDriverWait(driver, 10).until(
@@ -134,24 +246,22 @@ def login_to_naver_place(driver):
             EC.presence_of_element_located((By.ID, "pw"))
         )
         
-        # pyperclip을 사용하여 아이디 입력
-        print("아이디 입력 중...")
-        pyperclip.copy(NAVER_ID)
-        id_input.click()
-        time.sleep(0.5)
-        id_input.send_keys(Keys.CONTROL, 'v')
+        # 아이디 입력 (세션 단위 입력, 입력 후 내용 확인)
+        logger.info("아이디 입력 중... (입력 방식: %s)", text_input.method)
+        text_input.insert(driver, id_input, NAVER_ID)
         time.sleep(0.5)
+        if not text_input.matches(driver, id_input, NAVER_ID):
+            logger.warning("아이디 입력 내용이 일치하지 않습니다.")
         
-        # pyperclip을 사용하여 비밀번호 입력
-        print("비밀번호 입력 중...")
-        pyperclip.copy(NAVER_PW)
-        pw_input.click()
-        time.sleep(0.5)
-        pw_input.send_keys(Keys.CONTROL, 'v')
+        # 비밀번호 입력
+        logger.info("비밀번호 입력 중...")
+        text_input.insert(driver, pw_input, NAVER_PW)
         time.sleep(0.5)
+        if not text_input.matches(driver, pw_input, NAVER_PW):
+            logger.warning("비밀번호 입력 내용이 일치하지 않습니다.")
         
         # 로그인 버튼 클릭 (여러 방법 시도)
-        print("로그인 버튼 클릭 중...")
+        logger.info("로그인 버튼 클릭 중...")
         try:
             # 방법 1: ID로 찾기
             login_submit = WebDriverWait(driver, 5).until(
@@ -168,26 +278,27 @@ def login_to_naver_place(driver):
                 pw_input.send_keys(Keys.RETURN)
         
         # 로그인 완료 대기
-        print("로그인 완료 대기 중...")
+        logger.info("로그인 완료 대기 중...")
         time.sleep(2)
 
         # 3. 네이버 플레이스로 이동
-        print("네이버 플레이스 사이트로 이동 중...")
+        logger.info("네이버 플레이스 사이트로 이동 중...")
         driver.get("https://new.smartplace.naver.com/")
         time.sleep(3)
 
         # 4. 내 업체 찾기에서 업체명 클릭
-        print(f"'{BUSINESS_NAME}' 업체 찾는 중...")
+        report_phase("업체 선택")
+        logger.info("'%s' 업체 찾는 중...", BUSINESS_NAME)
         time.sleep(3)
 
         # 업체명으로 링크 찾기 (여러 방법 시도)
         try:
             # 방법 1: data-testid로 업체 카드 찾고 업체명 매칭
-            print("업체 카드 목록 검색 중...")
+            logger.info("업체 카드 목록 검색 중...")
             business_cards = WebDriverWait(driver, 10).until(
                 EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'li.Main_card_item__bTDIT[data-testid="main-biz-card"]'))
             )
-            print(f"발견된 업체 카드 수: {len(business_cards)}")
+            logger.info("발견된 업체 카드 수: %s", len(business_cards))
 
             found = False
             for idx, card in enumerate(business_cards):
@@ -195,143 +306,192 @@ def login_to_naver_place(driver):
                     # 업체명 찾기 (Main_title__P_c6n 클래스의 strong 태그)
                     title_element = card.find_element(By.CSS_SELECTOR, 'strong.Main_title__P_c6n')
                     card_name = title_element.text.strip()
-                    print(f"업체 {idx+1}: {card_name}")
+                    logger.debug("업체 %s: %s", idx+1, card_name)
 
                     if card_name == BUSINESS_NAME:
-                        print(f"'{BUSINESS_NAME}' 업체 찾음! 클릭 시도...")
+                        logger.info("'%s' 업체 찾음! 클릭 시도...", BUSINESS_NAME)
                         # 업체 카드 내의 링크 클릭
                         link = card.find_element(By.CSS_SELECTOR, 'a.Main_business_card__Q8DjV')
                         driver.execute_script("arguments[0].click();", link)
-                        print(f"'{BUSINESS_NAME}' 업체 클릭 완료!")
+                        logger.info("'%s' 업체 클릭 완료!", BUSINESS_NAME)
                         found = True
                         break
                 except Exception as e:
-                    print(f"카드 {idx+1} 처리 중 오류: {e}")
+                    logger.warning("카드 %s 처리 중 오류: %s", idx+1, e)
                     continue
 
             if not found:
-                print(f"'{BUSINESS_NAME}' 업체를 찾을 수 없습니다.")
+                logger.warning("'%s' 업체를 찾을 수 없습니다.", BUSINESS_NAME)
 
         except Exception as e:
-            print(f"업체 목록을 찾을 수 없습니다: {e}")
+            logger.warning("업체 목록을 찾을 수 없습니다: %s", e)
             # 방법 2: XPath로 직접 찾기
             try:
-                print("XPath 방식으로 재시도 중...")
+                logger.info("XPath 방식으로 재시도 중...")
                 business_link = driver.find_element(By.XPATH, f"//strong[contains(@class, 'Main_title__P_c6n') and text()='{BUSINESS_NAME}']/ancestor::a")
                 driver.execute_script("arguments[0].click();", business_link)
-                print(f"'{BUSINESS_NAME}' 업체 클릭 완료!")
+                logger.info("'%s' 업체 클릭 완료!", BUSINESS_NAME)
             except Exception as e2:
-                print(f"XPath 방식도 실패: {e2}")
+                logger.error("XPath 방식도 실패: %s", e2)
         
         time.sleep(2)
-        print("로그인 및 업체 선택 완료!")
+        logger.info("로그인 및 업체 선택 완료!")
 
         # 5. 팝업 닫기
-        print("팝업 닫기 시도 중...")
+        logger.info("팝업 닫기 시도 중...")
         time.sleep(2)
         try:
             close_button = WebDriverWait(driver, 5).until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, 'i.fn-booking.fn-booking-close1'))
             )
             close_button.click()
-            print("팝업 닫기 완료!")
+            logger.info("팝업 닫기 완료!")
             time.sleep(1)
         except Exception as e:
-            print(f"팝업이 없거나 닫기 실패: {e}")
+            logger.info("팝업이 없거나 닫기 실패: %s", e)
 
-        # 6. 리뷰 페이지로 이동
-        print("리뷰 페이지로 이동 중...")
+        debug_recorder.trace_point(driver, "로그인 완료")
+        return True
 
-        # 디버깅: 페이지 구조 확인
-        debug_page_structure(driver)
+    except Exception as e:
+        logger.exception("오류 발생: %s", e)
+        report_progress("error", message=f"로그인 중 오류: {e}")
+        debug_recorder.capture(driver, "login-error")
+        return False
+
+def open_review_page(driver):
+    """업체 대시보드에서 리뷰 페이지로 이동, 이동 성공 시 True 반환"""
+    # 6. 리뷰 페이지로 이동
+    report_phase("리뷰 페이지 이동")
+    logger.info("리뷰 페이지로 이동 중...")
+
+    # 추적 모드에서만 리뷰 버튼 찾기 전 페이지 저장
+    debug_recorder.trace_point(driver, "리뷰 버튼 찾기 전")
+
+    try:
+        # 여러 방법으로 리뷰 버튼 찾기 시도
+        review_button = None
 
+        # 방법 1: id="REVIEWS"를 가진 li 태그 내부의 a 태그 찾기 (가장 정확)
         try:
-            # 여러 방법으로 리뷰 버튼 찾기 시도
-            review_button = None
+            review_button = WebDriverWait(driver, 5).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'li#REVIEWS a.link'))
+            )
+            logger.info("방법 1로 리뷰 버튼 찾음 (li#REVIEWS)")
+        except Exception as e:
+            logger.debug("방법 1 실패: %s", e)
 
-            # 방법 1: id="REVIEWS"를 가진 li 태그 내부의 a 태그 찾기 (가장 정확)
+        # 방법 2: data-area-code 속성으로 찾기
+        if not review_button:
             try:
                 review_button = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'li#REVIEWS a.link'))
+                    EC.presence_of_element_located((By.CSS_SELECTOR, 'a[data-area-code="gnb.review"]'))
                 )
-                print("방법 1로 리뷰 버튼 찾음 (li#REVIEWS)")
+                logger.info("방법 2로 리뷰 버튼 찾음 (data-area-code)")
             except Exception as e:
-                print(f"방법 1 실패: {e}")
+                logger.debug("방법 2 실패: %s", e)
 
-            # 방법 2: data-area-code 속성으로 찾기
-            if not review_button:
-                try:
-                    review_button = WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'a[data-area-code="gnb.review"]'))
-                    )
-                    print("방법 2로 리뷰 버튼 찾음 (data-area-code)")
-                except Exception as e:
-                    print(f"방법 2 실패: {e}")
-
-            # 방법 3: data-ssr-action 속성으로 찾기
-            if not review_button:
-                try:
-                    review_button = driver.find_element(By.CSS_SELECTOR, 'a[data-ssr-action*="reviews"]')
-                    print("방법 3으로 리뷰 버튼 찾음 (data-ssr-action)")
-                except Exception as e:
-                    print(f"방법 3 실패: {e}")
-
-            # 방법 4: XPath로 id="REVIEWS" 기반 찾기
-            if not review_button:
-                try:
-                    review_button = driver.find_element(By.XPATH, "//li[@id='REVIEWS']//a")
-                    print("방법 4로 리뷰 버튼 찾음 (XPath - id REVIEWS)")
-                except Exception as e:
-                    print(f"방법 4 실패: {e}")
+        # 방법 3: data-ssr-action 속성으로 찾기
+        if not review_button:
+            try:
+                review_button = driver.find_element(By.CSS_SELECTOR, 'a[data-ssr-action*="reviews"]')
+                logger.info("방법 3으로 리뷰 버튼 찾음 (data-ssr-action)")
+            except Exception as e:
+                logger.debug("방법 3 실패: %s", e)
 
-            # 방법 5: 모든 a 태그 검색하여 "리뷰" 텍스트 포함 찾기
-            if not review_button:
-                try:
-                    print("방법 5 시도: 전체 링크 검색 중...")
-                    all_links = driver.find_elements(By.TAG_NAME, "a")
-                    print(f"총 {len(all_links)}개의 링크 발견")
-                    for link in all_links:
-                        link_text = link.text.strip()
-                        link_class = link.get_attribute("class") or ""
-                        link_href = link.get_attribute("href") or ""
-                        # 리뷰 텍스트 또는 reviews URL 포함
-                        if (link_text == "리뷰" or "review" in link_href.lower()) and link.is_displayed():
-                            review_button = link
-                            print(f"방법 5로 리뷰 버튼 찾음 (텍스트: '{link_text}', href: '{link_href[:50]}')")
-                            break
-                except Exception as e:
-                    print(f"방법 5 실패: {e}")
-
-            if review_button:
-                print(f"리뷰 버튼 찾음! href: {review_button.get_attribute('href')}")
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", review_button)
-                time.sleep(1)
-                driver.execute_script("arguments[0].click();", review_button)
-                print("리뷰 페이지 이동 완료!")
-                time.sleep(3)
-            else:
-                print("리뷰 버튼을 찾을 수 없습니다.")
-                print("현재 페이지 URL:", driver.current_url)
-                print("페이지 스크린샷을 저장합니다...")
-                driver.save_screenshot("review_button_not_found.png")
-                return
+        # 방법 4: XPath로 id="REVIEWS" 기반 찾기
+        if not review_button:
+            try:
+                review_button = driver.find_element(By.XPATH, "//li[@id='REVIEWS']//a")
+                logger.info("방법 4로 리뷰 버튼 찾음 (XPath - id REVIEWS)")
+            except Exception as e:
+                logger.debug("방법 4 실패: %s", e)
 
-        except Exception as e:
-            print(f"리뷰 버튼 클릭 중 오류 발생: {e}")
-            import traceback
-            traceback.print_exc()
-            return
+        # 방법 5: 모든 a 태그 검색하여 "리뷰" 텍스트 포함 찾기
+        if not review_button:
+            try:
+                logger.info("방법 5 시도: 전체 링크 검색 중...")
+                all_links = driver.find_elements(By.TAG_NAME, "a")
+                logger.info("총 %s개의 링크 발견", len(all_links))
+                for link in all_links:
+                    link_text = link.text.strip()
+                    link_class = link.get_attribute("class") or ""
+                    link_href = link.get_attribute("href") or ""
+                    # 리뷰 텍스트 또는 reviews URL 포함
+                    if (link_text == "리뷰" or "review" in link_href.lower()) and link.is_displayed():
+                        review_button = link
+                        logger.info("방법 5로 리뷰 버튼 찾음 (텍스트: '%s', href: '%s')", link_text, link_href[:50])
+                        break
+            except Exception as e:
+                logger.debug("방법 5 실패: %s", e)
 
-        # 7. 리뷰 답글 자동 작성
-        process_reviews(driver)
+        if review_button:
+            logger.info("리뷰 버튼 찾음! href: %s", review_button.get_attribute('href'))
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", review_button)
+            time.sleep(1)
+            driver.execute_script("arguments[0].click();", review_button)
+            logger.info("리뷰 페이지 이동 완료!")
+            time.sleep(3)
+        else:
+            logger.error("리뷰 버튼을 찾을 수 없습니다. (현재 페이지 URL: %s)", driver.current_url)
+            report_progress("error", message="리뷰 버튼을 찾을 수 없습니다.")
+            debug_recorder.capture(driver, "review-button-not-found")
+            return False
 
     except Exception as e:
-        print(f"오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
-
-def generate_ai_reply(review_text):
-    """AI를 사용하여 리뷰 답글 생성"""
+        logger.exception("리뷰 버튼 클릭 중 오류 발생: %s", e)
+        report_progress("error", message=f"리뷰 버튼 클릭 중 오류: {e}")
+        debug_recorder.capture(driver, "review-button-error")
+        return False
+
+    return True
+
+def report_decision(has_work, reason):
+    """사전 확인 판단 기록 (실행 시작부터 판단까지 걸린 시간 포함)"""
+    seconds = time.perf_counter() - run_started_at
+    if has_work:
+        logger.info("새 리뷰 확인: %s (판단까지 %.1f초)", reason, seconds)
+    else:
+        logger.info("새 리뷰 없음: %s, 리뷰 목록을 확인하지 않고 종료합니다. (판단까지 %.1f초)", reason, seconds)
+        report_progress("progress", done=0, remaining=0, replied=0, replies_per_minute=0.0)
+
+def precheck_dashboard(driver):
+    """대시보드의 미답변 리뷰 수로 사전 확인
+
+    반환: 0(할 일 없음), 양수(미답변 리뷰 있음), None(표시가 없거나 알 수 없음, 리뷰 목록에서 확인)
+    """
+    if not PRECHECK_ENABLED:
+        return None
+    count = read_dashboard_count(driver)
+    if count is None:
+        logger.debug("대시보드에 미답변 리뷰 수 표시가 없습니다. 리뷰 목록에서 확인합니다.")
+        return None
+    report_decision(count > 0, f"대시보드 미답변 리뷰 {count}건")
+    return count
+
+def precheck_review_list(driver, dashboard_count=None):
+    """최신 리뷰 지문을 지난 실행과 비교, (할 일 없음 여부, 지문) 반환
+
+    대시보드에 미답변 리뷰가 있다고 표시되었으면 지문이 같아도 할 일 있음으로 판단
+    (첫 화면 아래의 오래된 미답변 리뷰는 최신 리뷰 지문에 나타나지 않음)
+    """
+    if not wait_for_review_list(driver):
+        return False, None
+    fingerprint = newest_fingerprint(driver, PRECHECK_SIZE)
+    if not PRECHECK_ENABLED or fingerprint is None or dashboard_count:
+        return False, fingerprint
+    if precheck_state.unchanged(BUSINESS_NAME, fingerprint):
+        report_decision(False, f"최신 리뷰 {PRECHECK_SIZE}개가 지난 실행과 같고 남은 리뷰 없음")
+        return True, fingerprint
+    report_decision(True, "최신 리뷰가 지난 실행과 다르거나 남은 리뷰 있음")
+    return False, fingerprint
+
+def login_and_open_reviews(driver):
+    """로그인부터 리뷰 페이지까지 이동 (브라우저 재시작 후 세션 복원 실패 시 사용)"""
+    return login_to_naver_place(driver) and open_review_page(driver)
+
+def generate_ai_reply(review_text, analysis_result=None):
+    """AI를 사용하여 리뷰 답글 생성, (답글, 모델) 반환"""
     global ai_generator
 
     if ai_generator:
@@ -339,17 +499,26 @@ def generate_ai_reply(review_text):
         try:
             result = ai_generator.generate_reply(
                 review_content=review_text,
+                analysis_result=analysis_result,
                 brand_context=BUSINESS_NAME
             )
-            print(f"  - AI 모델: {result['model_used']}, 토큰: {result['tokens_used']}")
-            return result['reply']
+            logger.info("  - 등급: %s, AI 모델: %s, 토큰: %s+%s, 비용: $%.5f, 예산 상태: %s",
+                        result['tier'], result['model_used'], result['prompt_tokens'],
+                        result['completion_tokens'], result['cost_usd'], result['budget_status'])
+            return result['reply'], result['model_used']
         except Exception as e:
-            print(f"  - AI 답글 생성 실패, 템플릿 사용: {e}")
-            # 폴백: 템플릿 답글
-            return _generate_template_reply()
-    else:
-        # 템플릿 답글 사용
-        return _generate_template_reply()
+            logger.warning("  - AI 답글 생성 실패, 템플릿 사용: %s", e)
+
+    # 폴백: 템플릿 답글
+    return _generate_template_reply(), "template"
+
+def log_usage_summary():
+    """사용량 장부 기준 오늘/이번 달 비용 기록"""
+    for label, period in (("오늘", None), ("이번 달", time.strftime("%Y-%m"))):
+        summary = usage_ledger.summary(BUSINESS_NAME, period)
+        logger.info("%s 사용량: 답글 %s개, 토큰 %s+%s, 비용 $%.4f (답글당 $%.5f)",
+                    label, summary['replies'], summary['prompt_tokens'], summary['completion_tokens'],
+                    summary['cost_usd'], summary['cost_per_reply'])
 
 def _generate_template_reply():
     """템플릿 기반 답글 생성"""
@@ -360,132 +529,319 @@ def _generate_template_reply():
     ]
     return random.choice(replies)
 
-def process_reviews(driver):
-    """리뷰 답글 작성 프로세스"""
+# 리뷰 목록을 한 번의 스크립트 호출로 추출 (리뷰별 WebDriver 왕복 방지)
+EXTRACT_REVIEWS_SCRIPT = """
+return Array.from(document.querySelectorAll('li.Review_pui_review__zhZdn')).map(li => {
+    const text = li.querySelector('a[data-pui-click-code="text"]');
+    return {
+        element: li,
+        button: li.querySelector('button.Review_btn_write__pFgSj[data-area-code="rv.replywrite"]'),
+        text: text ? text.innerText.trim() : "",
+        full_text: li.innerText
+    };
+});
+"""
+
+def wait_for_review_list(driver, timeout=10):
+    """리뷰 목록이 나타날 때까지 대기, 표시되면 True 반환"""
     try:
-        print("\n=== 리뷰 답글 작성 시작 ===")
-
-        # 리뷰 목록 찾기
-        reviews = WebDriverWait(driver, 10).until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'li.Review_pui_review__zhZdn'))
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, 'li.Review_pui_review__zhZdn'))
         )
-        print(f"총 {len(reviews)} 개의 리뷰를 찾았습니다.")
-
-        replied_count = 0
-
-        for idx, review in enumerate(reviews):
-            try:
-                # 답글 쓰기 버튼이 있는지 확인 (답글이 없는 리뷰만 처리)
-                reply_buttons = review.find_elements(By.CSS_SELECTOR, 'button.Review_btn_write__pFgSj[data-area-code="rv.replywrite"]')
-
-                if not reply_buttons:
-                    print(f"리뷰 {idx+1}: 이미 답글이 있습니다. 건너뜁니다.")
-                    continue
-
-                print(f"\n--- 리뷰 {idx+1} 처리 중 ---")
-
-                # 1. 리뷰 내용 추출
-                try:
-                    review_text_element = review.find_element(By.CSS_SELECTOR, 'a[data-pui-click-code="text"]')
-                    review_text = review_text_element.text.strip()
-                    print(f"리뷰 내용: {review_text[:50]}...")
-                except Exception as e:
-                    print(f"리뷰 내용을 찾을 수 없습니다: {e}")
-                    continue
-
-                # 2. AI 답글 생성
-                print("AI 답글 생성 중...")
-                ai_reply = generate_ai_reply(review_text)
-                print(f"생성된 답글: {ai_reply[:50]}...")
-
-                # 3. 답글 쓰기 버튼 클릭
-                print("답글 쓰기 버튼 클릭 중...")
-                reply_button = reply_buttons[0]
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", reply_button)
-                time.sleep(1)
-                driver.execute_script("arguments[0].click();", reply_button)
-                time.sleep(2)
-
-                # 4. 답글 입력창 찾기 및 입력
-                print("답글 입력 중...")
-                try:
-                    # 답글 입력창 (textarea 또는 contenteditable)
-                    reply_input = WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'textarea, [contenteditable="true"]'))
-                    )
-
-                    # pyperclip 사용하여 답글 입력
-                    pyperclip.copy(ai_reply)
-                    reply_input.click()
-                    time.sleep(0.5)
-                    reply_input.send_keys(Keys.CONTROL, 'v')
-                    time.sleep(1)
-
-                    print("답글 입력 완료!")
-
-                except Exception as e:
-                    print(f"답글 입력창을 찾을 수 없습니다: {e}")
-                    # ESC 키로 답글창 닫기
-                    driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ESCAPE)
-                    time.sleep(1)
-                    continue
-
-                # 5. 등록 버튼 클릭
-                print("등록 버튼 클릭 중...")
+    except Exception:
+        return False
+    debug_recorder.trace_point(driver, "리뷰 목록 표시")
+    return True
+
+def collect_pending_reviews(driver, skip=None):
+    """답글 대기 리뷰를 우선순위 큐에 담아 반환 (부정/강한 감정/최신/긴 리뷰 우선)
+
+    skip: 이번 실행에서 이미 시도한 리뷰 키 (브라우저 재시작 후 다시 수집할 때 제외)
+    """
+    reviews = driver.execute_script(EXTRACT_REVIEWS_SCRIPT)
+    logger.info("총 %s 개의 리뷰를 찾았습니다.", len(reviews))
+
+    queue = ReviewQueue()
+    for position, review in enumerate(reviews):
+        # 답글 쓰기 버튼이 있는 리뷰만 처리 대상 (답글이 없는 리뷰)
+        if not review["button"]:
+            logger.info("리뷰 %s: 이미 답글이 있습니다. 건너뜁니다.", position+1)
+            continue
+        if skip and review["full_text"] in skip:
+            continue
+        queue.push({
+            "position": position,
+            "key": review["full_text"],
+            "element": review["element"],
+            "button": review["button"],
+            "text": review["text"],
+            "date": parse_review_date(review["full_text"]),
+            "analysis": simple_sentiment_analysis(review["text"])
+        })
+    return queue
+
+def reply_to_review(poster, item):
+    """리뷰 1건에 답글 작성, (등록 여부, 화면 표시 확인 여부) 반환
+
+    요청 재생으로 등록한 답글은 마지막에 한꺼번에 확인하므로 표시 확인 여부는 None
+    """
+    idx = item["position"]
+    review_text = item["text"]
+
+    # 1. 리뷰 내용 (텍스트가 없으면 사진 리뷰로 처리)
+    if review_text:
+        logger.debug("리뷰 내용: %s", review_text)
+    else:
+        logger.info("리뷰 내용 없음 (사진 리뷰)")
+
+    # 2. AI 답글 생성
+    logger.debug("AI 답글 생성 중...")
+    with timed(logger, "답글 생성", logging.INFO):
+        ai_reply, model_used = generate_ai_reply(review_text, item["analysis"])
+    debug_recorder.breadcrumb("답글 생성", review=idx + 1, length=len(ai_reply))
+    logger.info("생성된 답글: %s...", ai_reply[:50])
+
+    # 3. 답글 등록 (답글 쓰기 → 입력 → 등록 → 화면 표시 확인)
+    logger.debug("답글 등록 중...")
+    with timed(logger, "답글 등록", logging.INFO):
+        result = poster.post(item["element"], item["button"], ai_reply)
+    timings = ", ".join(f"{state} {seconds:.1f}초" for state, seconds in result["timings"].items())
+    logger.debug("  - 단계별 소요 시간: %s", timings)
+    debug_recorder.breadcrumb(
+        "답글 등록", review=idx + 1, state=result["state"], error=result["error"],
+        timings={state: round(seconds, 2) for state, seconds in result["timings"].items()}
+    )
+    debug_recorder.trace_point(poster.driver, f"리뷰 {idx+1} 답글 등록 후")
+
+    if result["state"] not in (STATE_SUBMITTED, STATE_RENDERED):
+        logger.error("답글 등록 실패: %s", result['error'])
+        report_progress("error", message=f"리뷰 {idx+1} 답글 등록 실패: {result['error']}")
+        debug_recorder.capture(poster.driver, f"review-{idx+1}-post-failed")
+        return False, None
+
+    if result["verified"]:
+        logger.info("답글 등록 완료! (화면 표시 확인)")
+    elif result["via"] == "api" and result["error"]:
+        # 요청 결과를 알 수 없음: 중복 등록을 막기 위해 다시 등록하지 않고 마지막 표시 확인에 맡김
+        logger.warning("답글 요청 결과 불확실 (화면 표시는 마지막에 확인): %s", result['error'])
+    elif result["via"] == "api":
+        logger.info("답글 등록 완료! (요청 재생, 화면 표시는 마지막에 확인)")
+    else:
+        # 등록 버튼은 눌렸으나 표시를 확인하지 못함 (다음 실행에서 미답변이면 다시 처리됨)
+        logger.warning("답글 등록 완료 (화면 표시 미확인): %s", result['error'])
+        report_progress("error", message=f"리뷰 {idx+1} 답글 표시 미확인")
+
+    # 답글 수는 등록된 답글만 집계 (생성 시 토큰/비용은 이미 기록됨)
+    usage_ledger.record(BUSINESS_NAME, model_used, replies=1)
+    reply_history.add(ai_reply)
+    review_index.add(review_text, ai_reply)
+    report_progress("reply", review=review_text, reply=ai_reply, verified=result["verified"])
+    return True, None if result["via"] == "api" else result["verified"]
+
+def create_poster(driver):
+    """답글 등록기 생성 (reply_post_method가 "api"면 요청 재생, 재생할 수 없으면 화면 클릭)"""
+    poster = ReplyPoster(driver, text_input)
+    if config.get("reply_post_method", "ui") == "api":
+        return ApiReplyPoster(driver, poster, recording_path=config.get("reply_api_recording", RECORDING_FILE))
+    return poster
+
+def process_reviews(supervisor, fingerprint=None):
+    """리뷰 답글 작성 프로세스 (리뷰 사이마다 브라우저 상태를 확인하고 필요하면 재시작)
+
+    fingerprint: 사전 확인에서 계산한 최신 리뷰 지문 (남은 리뷰 수와 함께 저장하여 다음 실행에서 비교)
+    """
+    try:
+        logger.info("=== 리뷰 답글 작성 시작 ===")
+        report_phase("답글 작성")
+
+        # 리뷰 목록이 나타날 때까지 대기
+        if not wait_for_review_list(supervisor.driver):
+            raise TimeoutError("리뷰 목록이 표시되지 않았습니다.")
+
+        queue = collect_pending_reviews(supervisor.driver)
+        attempted = set()
+        total = len(queue)
+        logger.info("답글 대기 중인 리뷰: %s개 (부정/최신 리뷰 우선 처리)", total)
+
+        # 실행당 시간/답글 수 한도 (남은 리뷰는 다음 실행에서 처리)
+        budget = RunBudget(
+            max_seconds=float(config.get("max_run_minutes", 0) or 0) * 60,
+            max_replies=int(config.get("max_replies_per_run", 0) or 0)
+        )
+        poster = create_poster(supervisor.driver)
+        done = 0
+        # 화면 클릭 등록 후 표시를 확인하지 못한 답글 수
+        unverified = 0
+        report_progress("progress", done=0, remaining=total, replied=0, replies_per_minute=0.0)
+
+        while queue:
+            # 취소는 리뷰 사이에서만 반영 (작성 중인 답글은 마무리)
+            if is_cancelled():
+                logger.info("취소 요청으로 답글 작성을 중단합니다.")
+                break
+
+            # 지금까지의 리뷰당 평균 소요 시간으로 다음 리뷰가 한도 안에 끝날지 판단
+            average_seconds = budget.elapsed() / done if done else 0.0
+            stop_reason = budget.exhausted_reason(average_seconds)
+            if stop_reason:
+                logger.info("%s, 남은 리뷰 %s개는 다음 실행에서 처리합니다.", stop_reason, len(queue))
+                break
+
+            # 안전 지점(리뷰 사이): 메모리/단계 시간 한도를 넘었으면 브라우저 재시작 후 리뷰 다시 수집
+            recycle_reason = supervisor.check()
+            if recycle_reason:
+                report_phase("브라우저 재시작")
+                if not supervisor.recycle(recycle_reason):
+                    logger.error("브라우저 재시작 후 리뷰 페이지를 복원하지 못했습니다. 남은 리뷰 %s개는 다음 실행에서 처리합니다.",
+                                 len(queue))
+                    report_progress("error", message="브라우저 재시작 후 리뷰 페이지 복원 실패")
+                    break
+                report_phase("답글 작성")
+                poster.rebind(supervisor.driver)
+                queue = collect_pending_reviews(supervisor.driver, skip=attempted)
+                total = done + len(queue)
+                if not queue:
+                    break
+
+            item = queue.pop()
+            attempted.add(item["key"])
+            done += 1
+            sentiment = item["analysis"]["sentiment"]
+            # 리뷰 처리 중 로그 항목에는 리뷰 번호 기록
+            with log_context(review_id=item["position"] + 1), supervisor.step("리뷰 처리"):
+                logger.info("--- 리뷰 처리 중 (%s/%s, 감정: %s) ---", done, total, sentiment)
                 try:
-                    register_button = WebDriverWait(driver, 5).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, 'button.Review_btn_enter__az8i7[data-area-code="rv.replydone"]'))
-                    )
-                    driver.execute_script("arguments[0].click();", register_button)
-                    print("답글 등록 완료!")
-                    replied_count += 1
-
-                    # 등록 후 대기
-                    time.sleep(2)
-
+                    posted, verified = reply_to_review(poster, item)
                 except Exception as e:
-                    print(f"등록 버튼을 찾을 수 없습니다: {e}")
-                    # ESC 키로 답글창 닫기
-                    driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ESCAPE)
-                    time.sleep(1)
-                    continue
-
-                # 6. 스크래핑 감지 방지를 위한 랜덤 대기 (5~10초)
-                wait_time = random.randint(5, 10)
-                print(f"스크래핑 감지 방지 대기 중... ({wait_time}초)")
-                time.sleep(wait_time)
-
-            except Exception as e:
-                print(f"리뷰 {idx+1} 처리 중 오류 발생: {e}")
-                continue
+                    logger.exception("리뷰 처리 중 오류 발생: %s", e)
+                    report_progress("error", message=f"리뷰 {item['position']+1} 처리 중 오류: {e}")
+                    posted, verified = False, None
+                    # 브라우저가 응답하지 않으면 다음 리뷰 전에 재시작
+                    if not supervisor.is_responsive():
+                        supervisor.request_recycle("브라우저 응답 없음")
+
+            if posted:
+                budget.replied += 1
+                # 화면 클릭으로 등록했지만 표시를 확인하지 못한 답글은 다음 실행에서 다시 확인
+                if verified is False:
+                    unverified += 1
+
+            elapsed_minutes = budget.elapsed() / 60
+            report_progress(
+                "progress",
+                done=done,
+                remaining=len(queue),
+                replied=budget.replied,
+                replies_per_minute=budget.replied / elapsed_minutes if elapsed_minutes > 0 else 0.0
+            )
 
-        print(f"\n=== 리뷰 답글 작성 완료 ===")
-        print(f"총 {replied_count}개의 답글을 작성했습니다.")
+            # 스크래핑 감지 방지를 위한 답글 사이 랜덤 대기 (등록 과정과 별개의 정책)
+            if posted and queue and not budget.exhausted_reason():
+                wait_time = pacing.next_delay()
+                logger.info("스크래핑 감지 방지 대기 중... (%.1f초)", wait_time)
+                if wait_unless_cancelled(wait_time):
+                    logger.info("취소 요청으로 답글 작성을 중단합니다.")
+                    break
+
+        # 요청 재생으로 등록한 답글은 목록을 한 번 새로 고쳐 표시 확인
+        rendered = poster.finish()
+        if rendered:
+            logger.info("요청 재생 답글 표시 확인: %s/%s건", rendered["verified"], rendered["checked"])
+            for snippet in rendered["missing"]:
+                logger.warning("  - 표시 미확인: %s...", snippet)
+            if rendered["missing"]:
+                report_progress("error", message=f"요청 재생 답글 {len(rendered['missing'])}건 표시 미확인")
+
+        logger.info("=== 리뷰 답글 작성 완료 ===")
+        # 남은 리뷰 + 등록 실패 + 표시 미확인(화면 클릭, 요청 재생)이 없어야 다음 실행에서 같은 지문을 할 일 없음으로 판단
+        pending = len(queue) + (done - budget.replied) + unverified + (len(rendered["missing"]) if rendered else 0)
+        precheck_state.record(BUSINESS_NAME, fingerprint, pending)
+        logger.info("총 %s개의 답글을 작성했습니다. (남은 리뷰 %s개, 소요 시간 %.0f초)",
+                    budget.replied, len(queue), budget.elapsed())
+        if isinstance(poster, ApiReplyPoster):
+            logger.info("답글 등록 방식: 요청 재생 %s건, 화면 클릭 %s건 (재생 실패 %s회, 결과 불확실 %s건)",
+                        poster.stats["api"], poster.stats["ui"], poster.stats["api_failed"],
+                        poster.stats["api_uncertain"])
+        log_usage_summary()
+        if ai_generator:
+            logger.info("유사 리뷰 답글 재사용으로 생략한 API 호출: %s회 (검색 대상 리뷰 %s개)",
+                        ai_generator.api_calls_saved, len(review_index))
+            validation = ai_generator.validation_stats
+            logger.info("작성 규칙 검증: 로컬 수정 %s건, 재생성 %s회, 템플릿 대체 %s건",
+                        validation["fixed"], validation["regenerated"], validation["rejected"])
+            for tier, stats in ai_generator.tier_report().items():
+                if stats["count"]:
+                    logger.info("  - 등급 %s: %s건, 평균 %.2f초", tier, stats['count'], stats['avg_seconds'])
 
     except Exception as e:
-        print(f"리뷰 처리 중 오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
-
-def main():
-    """메인 함수"""
-    driver = None
+        logger.exception("리뷰 처리 중 오류 발생: %s", e)
+        report_progress("error", message=f"리뷰 처리 중 오류: {e}")
+        debug_recorder.capture(supervisor.driver, "process-reviews-error")
+
+def main(events=None, cancel=None):
+    """메인 함수
+
+    GUI 러너에서 호출할 때는 진행 이벤트 큐(events)와 취소 이벤트(cancel)를 전달
+    """
+    global progress_queue, cancel_event, run_started_at
+    progress_queue = events
+    cancel_event = cancel
+    run_started_at = time.perf_counter()
+
+    # 브라우저 메모리/단계 시간 감시 (한도를 넘으면 리뷰 사이에서 재시작 후 리뷰 페이지 복원)
+    supervisor = DriverSupervisor(
+        launch=setup_driver,
+        relogin=login_and_open_reviews,
+        is_ready=wait_for_review_list,
+        max_memory_mb=float(config.get("max_browser_memory_mb", 1500) or 0),
+        max_step_seconds=float(config.get("max_step_seconds", 180) or 0),
+        recycle_every=int(config.get("recycle_every_reviews", 0) or 0),
+        page_load_timeout=float(config.get("page_load_timeout", 60))
+    )
     try:
-        driver = setup_driver()
-        login_to_naver_place(driver)
-        
-        # 작업 완료 후 브라우저 유지 (필요시 주석 처리)
-        print("작업 완료. 브라우저를 30초간 유지합니다...")
-        time.sleep(30)
+        report_phase("브라우저 시작")
+        driver = supervisor.start()
+
+        nothing_to_do = False
+        if login_to_naver_place(driver):
+            # 6-1. 사전 확인: 대시보드 미답변 수가 0이면 리뷰 페이지로 이동하지 않음
+            dashboard_count = precheck_dashboard(driver)
+            nothing_to_do = dashboard_count == 0
+            if not nothing_to_do and open_review_page(driver):
+                # 6-2. 사전 확인: 최신 리뷰가 지난 실행과 같으면 리뷰 목록 전체를 확인하지 않음
+                # (대시보드에 미답변 리뷰가 표시되었으면 지문과 관계없이 리뷰 목록 확인)
+                nothing_to_do, fingerprint = precheck_review_list(driver, dashboard_count)
+
+                # 7. 리뷰 답글 자동 작성
+                if not nothing_to_do:
+                    if is_cancelled():
+                        logger.info("취소 요청으로 답글 작성을 시작하지 않습니다.")
+                    else:
+                        process_reviews(supervisor, fingerprint)
+
+        # 작업 완료 후 브라우저 유지 (필요시 주석 처리, 취소 시 즉시 종료, 할 일이 없었으면 바로 종료)
+        if not is_cancelled() and not nothing_to_do:
+            logger.info("작업 완료. 브라우저를 30초간 유지합니다...")
+            wait_unless_cancelled(30)
         
     except Exception as e:
-        print(f"오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("오류 발생: %s", e)
+        report_progress("error", message=f"실행 중 오류: {e}")
+        debug_recorder.capture(supervisor.driver, "run-error")
     finally:
-        if driver:
-            driver.quit()
-            print("브라우저 종료")
+        health = supervisor.report()
+        slowest = health["slowest_step"]
+        logger.info("브라우저 재시작 %s회, 최대 메모리 %.0fMB (%s), 가장 오래 걸린 단계: %s %.1f초",
+                    health["recycles"], health["peak_memory_mb"], health["memory_source"] or "측정 안 됨",
+                    slowest["name"] or "-", slowest["seconds"])
+        for reason in health["recycle_reasons"]:
+            logger.info("  - 재시작 사유: %s", reason)
+        if supervisor.driver:
+            supervisor.quit()
+            logger.info("브라우저 종료")
+        report_phase("취소됨" if is_cancelled() else "완료")
+        # 큐에 남은 로그 출력 후 파이프라인 정리
+        shutdown_logging()
 
 if __name__ == "__main__":
     main()
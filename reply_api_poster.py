@@ -0,0 +1,532 @@
+"""
+페이지 요청 재생 방식 답글 등록
+화면 클릭으로 답글을 1건 등록할 때 스마트플레이스가 보내는 XHR/fetch 요청을 기록해 두고,
+이후 답글은 로그인된 페이지 안에서 같은 요청을 execute_async_script로 재생 (리뷰 ID와 답글만 교체)
+재생한 답글은 실행 마지막에 목록을 한 번 새로 고쳐 표시를 확인
+요청이 확실히 처리되지 않았을 때(보내기 전 오류, 4xx 응답)만 화면 클릭으로 다시 등록하고,
+등록 여부를 알 수 없으면(시간 초과, 연결 끊김, 5xx, 해석할 수 없는 응답) 중복 등록을 막기 위해 표시 확인에 맡김
+
+기록 파일 (reply_api_recording.json): 요청 템플릿과 기록 당시 응답
+    {"recorded_at", "review_id_key", "review_id", "review_id_checked", "reply_text", "reply_encoding",
+     "request": {"url", "method", "headers", "body"}, "response": {"status", "body"}}
+리뷰 ID는 다른 리뷰 요소와 값이 다른 후보만 사용하며 (업체 ID처럼 리뷰끼리 같은 값 제외),
+템플릿에 등록한 리뷰의 다른 고유 값이 그대로 남아 있으면 기록하지 않음
+
+오프라인 확인 (브라우저 없이 기록된 응답으로 재생):
+    python reply_api_poster.py reply_api_recording.json
+    python reply_api_poster.py reply_api_recording.json --status 403   # 거부 응답 모사 (화면 클릭으로 등록)
+    python reply_api_poster.py reply_api_recording.json --status 500   # 서버 오류 응답 모사 (등록 여부 불확실)
+"""
+
+from typing import Callable, Dict, List, Optional
+from urllib.parse import quote, quote_plus
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+from selenium.common.exceptions import TimeoutException
+
+from reply_poster import STATE_RENDERED, STATE_SUBMITTED, reply_snippet
+
+logger = logging.getLogger(__name__)
+
+
+RECORDING_FILE = "reply_api_recording.json"
+
+# 템플릿 자리표시자
+REVIEW_ID_PLACEHOLDER = "__REVIEW_ID__"
+REPLY_PLACEHOLDER = "__REPLY__"
+
+# 요청 본문에 답글이 들어가는 형식 (앞에서부터 확인)
+REPLY_ENCODINGS = {
+    "json": lambda text: json.dumps(text, ensure_ascii=False)[1:-1],
+    "form": quote_plus,
+    "url": lambda text: quote(text, safe=""),
+    "raw": lambda text: text,
+}
+
+# 브라우저가 직접 채우는 헤더 (재생 요청에서 제외)
+BROWSER_HEADERS = {"content-length", "cookie", "host", "origin", "referer", "user-agent", "accept-encoding", "connection"}
+
+# 인증 정보가 담긴 헤더 (이번 실행의 재생에만 사용하고 기록 파일에는 저장하지 않음)
+SENSITIVE_HEADERS = {"cookie", "authorization"}
+SENSITIVE_HEADER_PREFIXES = ("x-csrf", "x-xsrf")
+
+# XHR/fetch 기록기 (GET이 아닌 문자열 본문 요청만 최근 20건 기록, 이미 설치되어 있으면 기록만 비움)
+RECORDER_SCRIPT = """
+if (window.__replyRecorder) { window.__replyRecorder.length = 0; return; }
+const log = window.__replyRecorder = [];
+const keep = entry => { log.push(entry); if (log.length > 20) log.shift(); };
+const absolute = url => new URL(String(url), location.href).href;
+
+const originalFetch = window.__replyRecorderFetch = window.fetch;
+window.fetch = function (input, init) {
+    init = init || {};
+    const method = String(init.method || (input && input.method) || "GET").toUpperCase();
+    const body = init.body instanceof URLSearchParams ? init.body.toString() : init.body;
+    const promise = originalFetch.apply(this, arguments);
+    if (method !== "GET" && typeof body === "string") {
+        const headers = {};
+        new Headers(init.headers || {}).forEach((value, name) => { headers[name] = value; });
+        const entry = {url: absolute(typeof input === "string" ? input : input.url), method, headers, body,
+                       status: null, response: null};
+        keep(entry);
+        promise.then(r => r.clone().text().then(text => { entry.status = r.status; entry.response = text; }))
+               .catch(() => {});
+    }
+    return promise;
+};
+
+const open = XMLHttpRequest.prototype.open;
+const setRequestHeader = XMLHttpRequest.prototype.setRequestHeader;
+const send = XMLHttpRequest.prototype.send;
+XMLHttpRequest.prototype.open = function (method, url) {
+    this.__replyRecord = {method: String(method).toUpperCase(), url: absolute(url), headers: {}};
+    return open.apply(this, arguments);
+};
+XMLHttpRequest.prototype.setRequestHeader = function (name, value) {
+    if (this.__replyRecord) { this.__replyRecord.headers[name.toLowerCase()] = value; }
+    return setRequestHeader.apply(this, arguments);
+};
+XMLHttpRequest.prototype.send = function (body) {
+    const record = this.__replyRecord;
+    if (record && record.method !== "GET" && typeof body === "string") {
+        const entry = {...record, body, status: null, response: null};
+        keep(entry);
+        this.addEventListener("loadend", () => { entry.status = this.status; entry.response = String(this.responseText || ""); });
+    }
+    return send.apply(this, arguments);
+};
+"""
+
+TAKE_RECORDS_SCRIPT = "return (window.__replyRecorder || []).splice(0);"
+
+# 리뷰 요소에서 ID 후보 수집: [키, 값] (id/data-* 속성, 링크 경로 조각/쿼리 값, 숫자가 포함된 값만)
+# arguments[1]이 true면 같은 태그/클래스의 다른 리뷰 요소에서 수집 (리뷰끼리 같은 값을 가려내는 용도)
+REVIEW_ID_CANDIDATES_SCRIPT = """
+let root = arguments[0];
+if (arguments[1]) {
+    const selector = root.tagName.toLowerCase() + Array.from(root.classList, name => "." + CSS.escape(name)).join("");
+    root = Array.from(document.querySelectorAll(selector)).find(node => node !== root);
+    if (!root) return [];
+}
+const seen = new Set();
+const candidates = [];
+const add = (key, value) => {
+    value = String(value || "").trim();
+    if (seen.has(key) || !/^[\\w-]{4,}$/.test(value) || !/\\d/.test(value)) return;
+    seen.add(key);
+    candidates.push([key, value]);
+};
+for (const node of [root, ...root.querySelectorAll("*")]) {
+    for (const attr of node.attributes) {
+        if (attr.name === "id" || (attr.name.startsWith("data-") && attr.name !== "data-area-code")) {
+            add(attr.name, attr.value);
+        } else if (attr.name === "href") {
+            try {
+                const url = new URL(attr.value, location.href);
+                url.pathname.split("/").forEach((segment, i) => add("href:/" + i, segment));
+                url.searchParams.forEach((value, name) => add("href:" + name, value));
+            } catch (e) {}
+        }
+    }
+}
+return candidates;
+"""
+
+# 기록한 요청 재생 (기록기가 감싼 fetch가 아닌 원래 fetch 사용)
+# 요청 생성 단계의 오류는 보내기 전이므로 sent: false, 보낸 뒤 연결이 끊기면 status 0
+REPLAY_SCRIPT = """
+const [request, done] = arguments;
+const send = window.__replyRecorderFetch || window.fetch;
+let prepared;
+try {
+    prepared = new Request(request.url, {method: request.method, headers: request.headers, body: request.body,
+                                         credentials: "include"});
+} catch (e) {
+    done({status: 0, sent: false, body: String(e)});
+    return;
+}
+send.call(window, prepared)
+    .then(r => r.text().then(body => done({status: r.status, body})))
+    .catch(e => done({status: 0, body: String(e)}));
+"""
+
+# 새로 고친 목록에서 답글 문구 표시 확인 (모두 나타나거나 시간이 지나면 문구별 결과 반환)
+VERIFY_SCRIPT = """
+const [snippets, timeoutMs, done] = arguments;
+const normalize = s => (s || "").replace(/\\s+/g, " ");
+const check = () => { const text = normalize(document.body.textContent); return snippets.map(s => text.includes(s)); };
+let result = check();
+if (result.every(Boolean)) { done(result); return; }
+const observer = new MutationObserver(() => {
+    result = check();
+    if (result.every(Boolean)) { observer.disconnect(); clearTimeout(timer); done(result); }
+});
+observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+const timer = setTimeout(() => { observer.disconnect(); done(check()); }, timeoutMs);
+"""
+
+
+def learn_recording(
+    records: List[Dict],
+    candidates: List,
+    reply_text: str,
+    other_candidates: List
+) -> Optional[Dict]:
+    """화면 등록 중 기록된 요청에서 답글 등록 요청을 찾아 템플릿 생성 (찾지 못하거나 검증에 실패하면 None)
+
+    records: 기록기 항목, candidates: 등록한 리뷰 요소의 [키, 값] ID 후보, reply_text: 등록한 답글
+    other_candidates: 다른 리뷰 요소의 ID 후보 (같은 키에 다른 값이 있는 후보만 리뷰 ID로 인정)
+    """
+    others = dict(other_candidates)
+    # 리뷰마다 값이 다른 후보만 사용, 긴 값부터 확인 (짧은 값이 다른 값의 일부로 우연히 일치하는 것 방지)
+    candidates = sorted(
+        (candidate for candidate in candidates if candidate[0] in others and others[candidate[0]] != candidate[1]),
+        key=lambda candidate: -len(candidate[1])
+    )
+    if not candidates:
+        logger.info("다른 리뷰와 구분되는 리뷰 ID 후보가 없어 답글 등록 요청을 기록하지 않습니다.")
+        return None
+    for record in reversed(records):
+        if not record.get("status") or not 200 <= record["status"] < 300:
+            continue
+        encoding = next(
+            (name for name, encode in REPLY_ENCODINGS.items() if encode(reply_text) in record["body"]), None
+        )
+        if encoding is None:
+            continue
+
+        haystack = record["url"] + record["body"]
+        match = next((candidate for candidate in candidates if candidate[1] in haystack), None)
+        if match is None:
+            logger.info("답글 등록 요청에서 리뷰 ID를 찾지 못했습니다: %s", record["url"])
+            return None
+        key, review_id = match
+
+        encoded_reply = REPLY_ENCODINGS[encoding](reply_text)
+        url = record["url"].replace(review_id, REVIEW_ID_PLACEHOLDER)
+        body = record["body"].replace(encoded_reply, REPLY_PLACEHOLDER).replace(review_id, REVIEW_ID_PLACEHOLDER)
+
+        # 등록한 리뷰의 다른 고유 값이 남아 있으면 잘못된 값을 리뷰 ID로 고른 것 (모든 재생이 이 리뷰로 전송됨)
+        leftover = [value for _, value in candidates if value != review_id and value in url + body]
+        if leftover:
+            logger.info("답글 등록 요청에 리뷰 고유 값이 남아 있어 기록하지 않습니다: %s", ", ".join(leftover))
+            return None
+
+        return {
+            "recorded_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "review_id_key": key,
+            "review_id": review_id,
+            "review_id_checked": True,
+            "reply_text": reply_text,
+            "reply_encoding": encoding,
+            "request": {
+                "url": url,
+                "method": record["method"],
+                "headers": {
+                    name: value for name, value in record["headers"].items()
+                    if name.lower() not in BROWSER_HEADERS
+                },
+                "body": body,
+            },
+            "response": {"status": record["status"], "body": record["response"]},
+        }
+    return None
+
+
+def is_sensitive_header(name: str) -> bool:
+    """기록 파일에 저장하지 않을 인증 헤더인지 확인"""
+    name = name.lower()
+    return name in SENSITIVE_HEADERS or name.startswith(SENSITIVE_HEADER_PREFIXES)
+
+
+def load_recording(path: Optional[str]) -> Optional[Dict]:
+    """기록 파일 로드 (없거나 읽지 못하면 None)"""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            recording = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning("답글 요청 기록 파일을 읽지 못했습니다: %s", e)
+        return None
+    if not recording.get("review_id_checked"):
+        logger.info("리뷰 ID 검증 전 형식의 답글 요청 기록이라 사용하지 않습니다. 화면 등록 중에 다시 기록합니다.")
+        return None
+    return recording
+
+
+def build_request(recording: Dict, review_id: str, reply_text: str) -> Dict:
+    """템플릿에 리뷰 ID와 답글을 채운 요청"""
+    template = recording["request"]
+    encoded_reply = REPLY_ENCODINGS[recording["reply_encoding"]](reply_text)
+    return {
+        "url": template["url"].replace(REVIEW_ID_PLACEHOLDER, review_id),
+        "method": template["method"],
+        "headers": dict(template["headers"]),
+        "body": template["body"].replace(REVIEW_ID_PLACEHOLDER, review_id).replace(REPLY_PLACEHOLDER, encoded_reply),
+    }
+
+
+def check_response(recording: Dict, response: Dict) -> Optional[str]:
+    """재생 응답 확인: 실패 사유 (정상이면 None)"""
+    if response.get("sent") is False:
+        return f"요청을 보내지 못함: {str(response.get('body', ''))[:100]}"
+    status = response.get("status") or 0
+    if not 200 <= status < 300:
+        return f"HTTP {status}: {str(response.get('body', ''))[:100]}"
+
+    # 기록 당시 응답이 JSON이었다면 같은 형식이어야 하며 오류 항목이 없어야 함 (GraphQL은 오류도 200으로 응답)
+    try:
+        json.loads(recording["response"]["body"] or "")
+    except ValueError:
+        return None
+    try:
+        data = json.loads(response.get("body") or "")
+    except ValueError:
+        return "JSON이 아닌 응답"
+    if isinstance(data, dict) and (data.get("errors") or data.get("error")):
+        return f"오류 응답: {json.dumps(data.get('errors') or data.get('error'), ensure_ascii=False)[:100]}"
+    return None
+
+
+def not_landed(response: Dict) -> bool:
+    """실패한 재생 응답 중 요청이 확실히 처리되지 않은 경우 (보내기 전 오류, 4xx)"""
+    status = response.get("status") or 0
+    return response.get("sent") is False or 400 <= status < 500
+
+
+class RecordedTransport:
+    """오프라인 재생용 전송기: 네트워크 대신 기록된 응답을 돌려주고 보낸 요청을 보관
+
+    status를 지정하면 해당 상태 코드로 응답 (서버 오류 모사)
+    """
+
+    def __init__(self, recording: Dict, status: Optional[int] = None):
+        self.recording = recording
+        self.status = status
+        self.requests: List[Dict] = []
+
+    def __call__(self, request: Dict) -> Dict:
+        self.requests.append(request)
+        template = self.recording["request"]
+        if request["method"] != template["method"] or REVIEW_ID_PLACEHOLDER in request["url"] + request["body"] \
+                or REPLY_PLACEHOLDER in request["body"]:
+            return {"status": 400, "body": "요청이 템플릿과 맞지 않습니다."}
+        response = self.recording["response"]
+        return {"status": self.status or response["status"], "body": response["body"]}
+
+
+class ApiReplyPoster:
+    """요청 재생 방식 답글 등록기 (ReplyPoster와 같은 post/rebind/finish 인터페이스)
+
+    fallback: 화면 클릭 방식 ReplyPoster (템플릿이 없거나 재생이 실패하면 사용하며, 이때 요청을 기록해 템플릿 갱신)
+    transport: request -> {"status", "body"} (기본은 페이지 안에서 fetch, 오프라인 확인 시 RecordedTransport)
+    """
+
+    def __init__(
+        self,
+        driver,
+        fallback,
+        recording_path: Optional[str] = RECORDING_FILE,
+        transport: Optional[Callable] = None,
+        max_failures: int = 2
+    ):
+        self.driver = driver
+        self.fallback = fallback
+        self.recording_path = recording_path
+        self.transport = transport or self._page_fetch
+        self.max_failures = max_failures
+        self.recording = load_recording(recording_path)
+        self.failures = 0
+        self.disabled = False
+        # 마지막에 표시를 확인할 재생 답글 문구
+        self.pending: List[str] = []
+        self.stats = {"api": 0, "ui": 0, "api_failed": 0, "api_uncertain": 0}
+
+    def rebind(self, driver):
+        """새 드라이버로 교체 (브라우저 재시작 후, 템플릿과 확인 대기 목록은 유지)"""
+        self.driver = driver
+        if self.fallback is not None:
+            self.fallback.rebind(driver)
+
+    def post(self, review, reply_button, reply_text: str) -> Dict:
+        """답글 등록 (반환 형식은 ReplyPoster.post와 같으며 via는 "api" 또는 "ui")"""
+        if self.recording and not self.disabled:
+            review_id = dict(self._candidates(review)).get(self.recording["review_id_key"])
+            if review_id:
+                result = self.replay(review_id, reply_text)
+                if result is not None:
+                    return result
+            else:
+                logger.info("리뷰 요소에서 ID(%s)를 찾지 못해 화면 클릭으로 등록합니다.", self.recording["review_id_key"])
+        return self._post_via_ui(review, reply_button, reply_text)
+
+    def replay(self, review_id: str, reply_text: str) -> Optional[Dict]:
+        """기록한 요청 재생
+
+        요청이 확실히 처리되지 않았으면(보내기 전 오류, 4xx) None을 반환해 화면 클릭으로 등록
+        등록 여부를 알 수 없으면(시간 초과, status 0, 5xx, 해석할 수 없는 2xx) 다시 등록하지 않고
+        오류와 함께 미확인 등록으로 반환 (마지막 표시 확인과 다음 실행의 목록 확인에서 판단)
+        연속 max_failures회 실패 시 이번 실행은 화면 클릭만 사용
+        """
+        started_at = time.perf_counter()
+        try:
+            request = build_request(self.recording, review_id, reply_text)
+            response = self.transport(request)
+        except (TimeoutException, TimeoutError) as e:
+            # 스크립트가 응답을 기다리다 시간이 지남: 요청은 이미 보냈을 수 있음
+            response = {"status": 0, "body": f"{type(e).__name__}: {e}"}
+        except Exception as e:
+            # 템플릿 오류나 드라이버가 명령을 실행하지 못한 경우: 요청을 보내지 않음
+            response = {"status": 0, "sent": False, "body": f"{type(e).__name__}: {e}"}
+        seconds = time.perf_counter() - started_at
+
+        error = check_response(self.recording, response)
+        if error is None:
+            self.failures = 0
+            self.stats["api"] += 1
+            self.pending.append(reply_snippet(reply_text))
+            return {"state": STATE_SUBMITTED, "verified": False, "timings": {"replay": seconds}, "error": None, "via": "api"}
+
+        self.failures += 1
+        if not_landed(response):
+            self.stats["api_failed"] += 1
+            logger.warning("API 답글 등록 실패, 화면 클릭으로 등록합니다: %s", error)
+            result = None
+        else:
+            self.stats["api_uncertain"] += 1
+            self.pending.append(reply_snippet(reply_text))
+            logger.warning("API 답글 등록 결과를 알 수 없어 다시 등록하지 않고 마지막에 표시를 확인합니다: %s", error)
+            result = {"state": STATE_SUBMITTED, "verified": False, "timings": {"replay": seconds}, "error": error, "via": "api"}
+
+        if self.failures >= self.max_failures and not self.disabled:
+            self.disabled = True
+            logger.warning("API 답글 등록이 연속 %s회 실패하여 이번 실행은 화면 클릭으로만 등록합니다.", self.failures)
+        return result
+
+    def finish(self) -> Optional[Dict]:
+        """재생한 답글이 있으면 목록을 한 번 새로 고쳐 표시 확인
+
+        반환: {"checked": 확인 대상 수, "verified": 표시된 수, "missing": 표시되지 않은 문구} (대상이 없으면 None)
+        """
+        if not self.pending:
+            return None
+        snippets, self.pending = self.pending, []
+        try:
+            self.driver.refresh()
+            found = self.driver.execute_async_script(
+                VERIFY_SCRIPT, snippets, int(self.fallback.render_timeout * 1000)
+            )
+        except Exception as e:
+            logger.warning("재생한 답글 표시 확인 실패: %s", e)
+            found = [False] * len(snippets)
+        return {
+            "checked": len(snippets),
+            "verified": sum(bool(flag) for flag in found),
+            "missing": [snippet for snippet, flag in zip(snippets, found) if not flag],
+        }
+
+    def _post_via_ui(self, review, reply_button, reply_text: str) -> Dict:
+        """화면 클릭으로 등록 (템플릿이 없거나 직전 재생이 실패했으면 요청을 기록해 템플릿 갱신)"""
+        learn = not self.disabled and (self.recording is None or self.failures > 0)
+        candidates = []
+        other_candidates = []
+        if learn:
+            try:
+                self.driver.execute_script(RECORDER_SCRIPT)
+                # 등록 후 리뷰 요소가 다시 그려질 수 있으므로 ID 후보는 미리 수집
+                candidates = self._candidates(review)
+                other_candidates = self._candidates(review, other=True)
+            except Exception as e:
+                logger.debug("요청 기록기 설치 실패: %s", e)
+                learn = False
+
+        result = self.fallback.post(review, reply_button, reply_text)
+        self.stats["ui"] += 1
+
+        if learn and result["state"] in (STATE_SUBMITTED, STATE_RENDERED):
+            try:
+                records = self.driver.execute_script(TAKE_RECORDS_SCRIPT) or []
+            except Exception:
+                records = []
+            recording = learn_recording(records, candidates, reply_text, other_candidates)
+            if recording:
+                self.recording = recording
+                self.failures = 0
+                self._save()
+                logger.info("답글 등록 요청 기록 완료 (%s %s), 다음 답글부터 요청 재생으로 등록합니다.",
+                            recording["request"]["method"], recording["request"]["url"])
+            else:
+                logger.info("답글 등록 요청을 기록하지 못했습니다. (기록된 요청 %s건)", len(records))
+        return result
+
+    def _candidates(self, review, other: bool = False) -> List:
+        try:
+            return self.driver.execute_script(REVIEW_ID_CANDIDATES_SCRIPT, review, other) or []
+        except Exception:
+            return []
+
+    def _page_fetch(self, request: Dict) -> Dict:
+        return self.driver.execute_async_script(REPLAY_SCRIPT, request)
+
+    def _save(self):
+        if not self.recording_path:
+            return
+        # 인증 헤더는 메모리의 템플릿에만 두고 파일에는 제외 (다음 실행에서 필요하면 화면 등록 시 다시 기록)
+        request = self.recording["request"]
+        recording = dict(self.recording, request=dict(request, headers={
+            name: value for name, value in request["headers"].items() if not is_sensitive_header(name)
+        }))
+        try:
+            with open(self.recording_path, 'w', encoding='utf-8') as f:
+                json.dump(recording, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            logger.warning("답글 요청 기록 파일 저장 실패: %s", e)
+
+
+SAMPLE_REPLIES = [
+    "방문해 주셔서 감사합니다! 다음에도 좋은 시간 보내실 수 있도록 노력하겠습니다.",
+    "불편을 드려 정말 죄송합니다. 말씀해 주신 \"대기 시간\" 부분은 꼭 개선하겠습니다.",
+    "소중한 리뷰 감사합니다 😊\n항상 최선을 다하는 매장이 되겠습니다.",
+]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="답글 요청 기록 오프라인 재생")
+    parser.add_argument("recording", nargs="?", default=RECORDING_FILE, help=f"기록 파일 (기본 {RECORDING_FILE})")
+    parser.add_argument("--status", type=int, default=None, help="기록 대신 돌려줄 응답 상태 코드")
+    args = parser.parse_args()
+
+    recording = load_recording(args.recording)
+    if recording is None:
+        print(f"기록 파일 {args.recording}이 없습니다. reply_post_method를 \"api\"로 설정하고 한 번 실행하면 생성됩니다.")
+        return 1
+
+    transport = RecordedTransport(recording, status=args.status)
+    poster = ApiReplyPoster(None, None, recording_path=args.recording, transport=transport)
+
+    print(f"기록: {poster.recording['request']['method']} {poster.recording['request']['url']} "
+          f"(리뷰 ID {poster.recording['review_id_key']}, 답글 형식 {poster.recording['reply_encoding']})")
+    ok = 0
+    for reply_text in SAMPLE_REPLIES:
+        result = poster.replay(poster.recording["review_id"], reply_text)
+        sent = transport.requests[-1]
+        if result is None:
+            outcome = "실패 (화면 클릭으로 등록)"
+        elif result["error"]:
+            outcome = "불확실 (다시 등록하지 않고 표시 확인)"
+        else:
+            outcome = "성공"
+        print(f"  - {outcome}: {reply_snippet(reply_text)}... (본문 {len(sent['body'])}자)")
+        ok += result is not None and not result["error"]
+    print(f"\n{ok}/{len(SAMPLE_REPLIES)}건 재생 성공")
+    return 0 if ok == len(SAMPLE_REPLIES) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
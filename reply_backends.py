@@ -0,0 +1,133 @@
+"""
+답글 생성 백엔드
+OpenAI API, 로컬 CPU 모델(HTTP 서버), 템플릿 엔진을 같은 인터페이스로 사용
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List
+import json
+import urllib.request
+
+
+class ReplyBackend(ABC):
+    """답글 생성 백엔드 인터페이스 (generate를 구현하지 않은 백엔드는 생성 시점에 오류)
+
+    generate()는 {"text", "model", "prompt_tokens", "completion_tokens"} 딕셔너리 반환
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def generate(
+        self,
+        messages: List[Dict],
+        max_tokens: int,
+        temperature: float,
+        analysis_result: Dict
+    ) -> Dict:
+        ...
+
+
+class OpenAIBackend(ReplyBackend):
+    """OpenAI Chat Completions 백엔드"""
+
+    name = "openai"
+
+    def __init__(self, client, model: str = "gpt-4o-mini"):
+        self.client = client
+        self.model = model
+
+    def generate(self, messages, max_tokens, temperature, analysis_result):
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            presence_penalty=0.4,
+            frequency_penalty=0.3
+        )
+        return {
+            "text": response.choices[0].message.content.strip(),
+            "model": self.model,
+            "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
+            "completion_tokens": response.usage.completion_tokens if response.usage else 0
+        }
+
+
+class LocalHTTPBackend(ReplyBackend):
+    """로컬 CPU 모델 HTTP 백엔드
+
+    api_style:
+    - "openai": OpenAI 호환 /v1/chat/completions (llama.cpp server, Ollama, LM Studio 등)
+    - "llamacpp": llama.cpp server의 /completion
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:8080",
+        model: str = "local",
+        api_style: str = "openai",
+        timeout: float = 30.0
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.model = model
+        self.api_style = api_style
+        self.timeout = timeout
+
+    def _post(self, path: str, payload: Dict) -> Dict:
+        request = urllib.request.Request(
+            self.base_url + path,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read().decode("utf-8"))
+
+    def generate(self, messages, max_tokens, temperature, analysis_result):
+        if self.api_style == "llamacpp":
+            # 채팅 메시지를 단일 프롬프트로 변환
+            prompt = "\n\n".join(m["content"] for m in messages) + "\n"
+            data = self._post("/completion", {
+                "prompt": prompt,
+                "n_predict": max_tokens,
+                "temperature": temperature
+            })
+            return {
+                "text": data.get("content", "").strip(),
+                "model": self.model,
+                "prompt_tokens": data.get("tokens_evaluated", 0),
+                "completion_tokens": data.get("tokens_predicted", 0)
+            }
+
+        data = self._post("/v1/chat/completions", {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        })
+        usage = data.get("usage") or {}
+        return {
+            "text": data["choices"][0]["message"]["content"].strip(),
+            "model": self.model,
+            "prompt_tokens": usage.get("prompt_tokens", 0),
+            "completion_tokens": usage.get("completion_tokens", 0)
+        }
+
+
+class TemplateBackend(ReplyBackend):
+    """템플릿 엔진 백엔드 (API 호출 없음)"""
+
+    name = "template"
+
+    def __init__(self, template_fn: Callable[[Dict], str]):
+        self.template_fn = template_fn
+
+    def generate(self, messages, max_tokens, temperature, analysis_result):
+        return {
+            "text": self.template_fn(analysis_result),
+            "model": "template",
+            "prompt_tokens": 0,
+            "completion_tokens": 0
+        }
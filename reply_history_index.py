@@ -0,0 +1,103 @@
+"""
+게시된 답글 이력 인덱스
+답글의 n-gram 해시 벡터를 메모리 매핑된 NumPy 행렬로 저장하고
+새 답글과 최근 답글들의 최대 코사인 유사도를 한 번의 행렬 연산으로 계산
+"""
+
+from typing import Optional
+import json
+import os
+
+import numpy as np
+
+from text_vectors import DEFAULT_DIM, hashed_ngram_vector
+
+
+class ReplyHistoryIndex:
+    """답글 이력 인덱스 (.npy 메모리 맵 + 메타데이터 .json)"""
+
+    # 이 값 이상이면 같은 답글로 간주 (텍스트는 저장하지 않으므로 벡터로 판별)
+    SAME_REPLY_SIMILARITY = 0.999
+
+    def __init__(
+        self,
+        index_file: str = "reply_history.npy",
+        dim: int = DEFAULT_DIM,
+        window: int = 20000,
+        initial_capacity: int = 1024
+    ):
+        self.index_file = index_file
+        self.meta_file = os.path.splitext(index_file)[0] + ".json"
+        self.dim = dim
+        # 유사도 비교 대상: 최근 window개 답글
+        self.window = window
+        self.count = 0
+
+        index_dir = os.path.dirname(index_file)
+        if index_dir:
+            os.makedirs(index_dir, exist_ok=True)
+
+        if os.path.exists(index_file) and os.path.exists(self.meta_file):
+            with open(self.meta_file, 'r', encoding='utf-8') as f:
+                self.count = json.load(f).get("count", 0)
+            self._matrix = np.lib.format.open_memmap(index_file, mode="r+")
+            if self._matrix.shape[1] != dim:
+                raise ValueError(
+                    f"답글 이력 인덱스 차원 불일치: 파일 {self._matrix.shape[1]}, 설정 {dim}"
+                )
+        else:
+            self._matrix = np.lib.format.open_memmap(
+                index_file, mode="w+", dtype=np.float32, shape=(initial_capacity, dim)
+            )
+            self._save_meta()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _save_meta(self):
+        with open(self.meta_file, 'w', encoding='utf-8') as f:
+            json.dump({"count": self.count, "dim": self.dim}, f)
+
+    def _grow(self):
+        """저장 공간을 두 배로 확장 (새 파일에 복사한 뒤 교체)"""
+        capacity = self._matrix.shape[0] * 2
+        tmp_file = self.index_file + ".tmp.npy"
+        grown = np.lib.format.open_memmap(
+            tmp_file, mode="w+", dtype=np.float32, shape=(capacity, self.dim)
+        )
+        grown[:self.count] = self._matrix[:self.count]
+        grown.flush()
+
+        # Windows에서는 열린 메모리 맵 파일을 교체할 수 없으므로 먼저 해제
+        del grown
+        del self._matrix
+        os.replace(tmp_file, self.index_file)
+        self._matrix = np.lib.format.open_memmap(self.index_file, mode="r+")
+
+    def add(self, reply: str):
+        """게시된 답글 추가"""
+        if self.count >= self._matrix.shape[0]:
+            self._grow()
+
+        self._matrix[self.count] = hashed_ngram_vector(reply, self.dim)
+        self._matrix.flush()
+        self.count += 1
+        self._save_meta()
+
+    def similarities(self, text: str) -> np.ndarray:
+        """최근 답글들과의 코사인 유사도 배열 (벡터가 정규화되어 있어 내적 = 코사인)"""
+        if self.count == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        start = max(0, self.count - self.window)
+        return self._matrix[start:self.count] @ hashed_ngram_vector(text, self.dim)
+
+    def max_similarity(self, text: str, exclude: Optional[str] = None) -> float:
+        """최근 답글 중 가장 비슷한 답글과의 유사도 (이력이 없으면 0)
+
+        exclude: 비교에서 뺄 답글 (이력에서 이 답글과 사실상 같은 항목은 제외)
+        """
+        sims = self.similarities(text)
+        if exclude is not None and sims.size:
+            sims = sims[self.similarities(exclude) < self.SAME_REPLY_SIMILARITY]
+        return float(sims.max()) if sims.size else 0.0
@@ -0,0 +1,246 @@
+"""
+답글 등록 상태 머신
+답글 쓰기 → 입력창 준비 → 텍스트 입력 → 등록 → 답글 표시 확인 순서로 진행하며
+각 단계는 고정 대기 대신 DOM 조건(또는 MutationObserver 신호)이 충족되면 완료
+"""
+
+from typing import Callable, Dict, Optional
+import logging
+import random
+import time
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+
+EDITOR_SELECTOR = 'textarea, [contenteditable="true"]'
+REGISTER_BUTTON_SELECTOR = 'button.Review_btn_enter__az8i7[data-area-code="rv.replydone"]'
+
+# 등록 상태
+STATE_IDLE = "idle"
+STATE_EDITOR_OPEN = "editor_open"
+STATE_EDITOR_READY = "editor_ready"
+STATE_TEXT_PRESENT = "text_present"
+STATE_SUBMITTED = "submitted"
+STATE_RENDERED = "rendered"
+
+# 답글 표시 확인용 MutationObserver 스크립트 (리뷰 요소에 문구가 나타나면 true)
+WAIT_FOR_TEXT_SCRIPT = """
+const [element, snippet, timeoutMs, done] = arguments;
+const root = element && element.isConnected ? element : document.body;
+const normalize = s => (s || "").replace(/\\s+/g, " ");
+const found = () => normalize(root.textContent).includes(snippet);
+if (found()) { done(true); return; }
+const observer = new MutationObserver(() => {
+    if (found()) { observer.disconnect(); clearTimeout(timer); done(true); }
+});
+observer.observe(root, {childList: true, subtree: true, characterData: true});
+const timer = setTimeout(() => { observer.disconnect(); done(found()); }, timeoutMs);
+"""
+
+
+def reply_snippet(reply_text: str) -> str:
+    """답글 표시 확인에 쓰는 앞부분 (공백 정규화)"""
+    return " ".join(reply_text.split())[:20]
+
+
+class ReplyPostError(Exception):
+    """답글 등록 단계 실패"""
+
+    def __init__(self, step: str, message: str):
+        super().__init__(f"{step}: {message}")
+        self.step = step
+
+
+class PacingPolicy:
+    """답글 사이 대기 정책 (스크래핑 감지 방지용 랜덤 대기)"""
+
+    def __init__(self, min_seconds: float = 5, max_seconds: float = 10):
+        self.min_seconds = min_seconds
+        self.max_seconds = max(min_seconds, max_seconds)
+
+    def next_delay(self) -> float:
+        """다음 답글까지 대기 시간 (초)"""
+        return random.uniform(self.min_seconds, self.max_seconds)
+
+
+class ReplyPoster:
+    """리뷰 1건의 답글 등록 상태 머신
+
+    text_input은 insert(driver, element, text)와 matches(driver, element, text)를 제공하는 입력기
+    """
+
+    def __init__(
+        self,
+        driver,
+        text_input,
+        step_timeout: float = 5,
+        render_timeout: float = 8,
+        max_step_retries: int = 1
+    ):
+        self.text_input = text_input
+        self.step_timeout = step_timeout
+        self.render_timeout = render_timeout
+        self.max_step_retries = max_step_retries
+        self.rebind(driver)
+
+    def rebind(self, driver):
+        """새 드라이버로 교체 (브라우저 재시작 후)"""
+        self.driver = driver
+        self.driver.set_script_timeout(self.render_timeout + 5)
+
+    def finish(self) -> Optional[Dict]:
+        """실행 마무리 (화면 등록은 답글마다 표시를 확인하므로 할 일 없음)"""
+        return None
+
+    def post(self, review, reply_button, reply_text: str) -> Dict:
+        """답글 등록 실행
+
+        반환: {"state": 마지막 도달 상태, "verified": 답글 표시 확인 여부,
+               "timings": 단계별 소요 시간, "error": 실패 메시지, "via": 등록 방식 ("ui")}
+        """
+        context = {"review": review, "reply_button": reply_button, "reply_text": reply_text}
+        result = {"state": STATE_IDLE, "verified": False, "timings": {}, "error": None, "via": "ui"}
+
+        # (상태, 단계 함수, 재시도 횟수) - 표시 확인은 대기만 하므로 재시도하지 않음
+        steps = [
+            (STATE_EDITOR_OPEN, self._open_editor, self.max_step_retries),
+            (STATE_EDITOR_READY, self._wait_editor_ready, self.max_step_retries),
+            (STATE_TEXT_PRESENT, self._enter_text, self.max_step_retries),
+            (STATE_SUBMITTED, self._submit, self.max_step_retries),
+            (STATE_RENDERED, self._wait_rendered, 0),
+        ]
+
+        for state, step, retries in steps:
+            started_at = time.perf_counter()
+            try:
+                self._run_with_retry(state, step, context, retries)
+            except ReplyPostError as e:
+                result["error"] = str(e)
+                # 등록 전 실패는 입력창 닫기 (등록 후에는 화면을 건드리지 않음)
+                if result["state"] != STATE_SUBMITTED:
+                    self._close_editor()
+                break
+            finally:
+                result["timings"][state] = time.perf_counter() - started_at
+            result["state"] = state
+
+        result["verified"] = result["state"] == STATE_RENDERED
+        return result
+
+    def _run_with_retry(self, state: str, step: Callable, context: Dict, retries: int):
+        """실패한 단계만 재시도 (대기 초과/요소 교체만 재시도, 그 밖의 WebDriver 오류는 바로 실패 처리)"""
+        for attempt in range(retries + 1):
+            try:
+                step(context, attempt)
+                return
+            except (TimeoutException, StaleElementReferenceException) as e:
+                if attempt >= retries:
+                    raise ReplyPostError(state, f"{type(e).__name__}: {e}")
+                logger.warning("  - 단계 '%s' 실패, 재시도 (%s/%s): %s", state, attempt + 1, retries, type(e).__name__)
+            except WebDriverException as e:
+                # 클릭 가로막힘, 상호작용 불가 등: 상태 머신 밖으로 넘기지 않고 입력창을 닫은 뒤 실패로 기록
+                raise ReplyPostError(state, f"{type(e).__name__}: {e.msg}")
+
+    def _wait(self, condition, timeout: Optional[float] = None):
+        return WebDriverWait(self.driver, timeout or self.step_timeout, poll_frequency=0.1).until(condition)
+
+    def _find_displayed(self, review, selector: str):
+        """리뷰 영역 우선, 없으면 문서 전체에서 표시된 요소 검색"""
+        for scope in (review, self.driver):
+            try:
+                for element in scope.find_elements(By.CSS_SELECTOR, selector):
+                    if element.is_displayed():
+                        return element
+            except StaleElementReferenceException:
+                continue
+        return None
+
+    # 1. 답글 쓰기 클릭 → 입력창 표시
+    def _open_editor(self, context: Dict, attempt: int):
+        # 재시도 시 입력창이 이미 열려 있으면 다시 누르지 않음 (다시 누르면 닫힐 수 있음)
+        if attempt == 0 or not self._find_displayed(context["review"], EDITOR_SELECTOR):
+            button = context["reply_button"]
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
+            self.driver.execute_script("arguments[0].click();", button)
+        context["editor"] = self._wait(
+            lambda d: self._find_displayed(context["review"], EDITOR_SELECTOR) or False
+        )
+
+    # 2. 입력창 활성화 확인
+    def _wait_editor_ready(self, context: Dict, attempt: int):
+        if attempt:
+            context["editor"] = self._wait(
+                lambda d: self._find_displayed(context["review"], EDITOR_SELECTOR) or False
+            )
+        editor = context["editor"]
+        self._wait(lambda d: editor.is_enabled() and editor.is_displayed())
+
+    # 3. 텍스트 입력 → 입력창 내용 일치 확인
+    def _enter_text(self, context: Dict, attempt: int):
+        editor = context["editor"]
+        if attempt:
+            # 재시도 시 기존 내용 지우고 다시 입력
+            self.driver.execute_script(
+                "const e = arguments[0];"
+                "if ('value' in e) { e.value = ''; } else { e.textContent = ''; }"
+                "e.dispatchEvent(new Event('input', {bubbles: true}));",
+                editor
+            )
+        self.text_input.insert(self.driver, editor, context["reply_text"])
+        # 입력창 내용이 의도한 답글과 일치해야 다음 단계로 진행
+        self._wait(lambda d: self.text_input.matches(self.driver, editor, context["reply_text"]))
+
+    # 4. 등록 클릭 → 입력창/등록 버튼 사라짐
+    def _submit(self, context: Dict, attempt: int):
+        register_button = context.get("register_button")
+        # 재시도 시 이미 누른 등록 버튼이 사라졌다면 다시 누르지 않음 (중복 등록 방지)
+        if register_button is None or self._is_present(register_button):
+            register_button = self._wait(
+                lambda d: self._clickable(self._find_displayed(context["review"], REGISTER_BUTTON_SELECTOR))
+            )
+            context["register_button"] = register_button
+            self.driver.execute_script("arguments[0].click();", register_button)
+        self._wait(lambda d: not self._is_present(context["register_button"]))
+
+    # 5. 리뷰 영역에 답글 표시 확인 (MutationObserver)
+    def _wait_rendered(self, context: Dict, attempt: int):
+        snippet = reply_snippet(context["reply_text"])
+        review = context["review"]
+        try:
+            found = self.driver.execute_async_script(
+                WAIT_FOR_TEXT_SCRIPT, review, snippet, int(self.render_timeout * 1000)
+            )
+        except StaleElementReferenceException:
+            # 리뷰 요소가 다시 그려졌으면 문서 전체에서 확인
+            found = self.driver.execute_async_script(
+                WAIT_FOR_TEXT_SCRIPT, None, snippet, int(self.render_timeout * 1000)
+            )
+        if not found:
+            raise TimeoutException("등록한 답글이 화면에 표시되지 않았습니다.")
+
+    @staticmethod
+    def _clickable(element):
+        if element is not None and element.is_enabled():
+            return element
+        return False
+
+    @staticmethod
+    def _is_present(element) -> bool:
+        if element is None:
+            return False
+        try:
+            return element.is_displayed()
+        except StaleElementReferenceException:
+            return False
+
+    def _close_editor(self):
+        """ESC 키로 답글창 닫기"""
+        try:
+            self.driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ESCAPE)
+        except Exception:
+            pass
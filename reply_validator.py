@@ -0,0 +1,339 @@
+"""
+답글 규칙 검증기
+답글을 한 번 순회하며 길이(자소 결합 단위 글자 수), 이모지 수, 고객 키워드 포함, 금지 표현, 문장 수를
+함께 검사하고 규칙별 결과와 점수를 반환
+"""
+
+from typing import Dict, Iterable, List, Tuple
+from collections import deque
+import re
+import unicodedata
+
+
+# 문장을 끝내는 문장 부호
+TERMINAL_PUNCTUATION = frozenset(".!?…~")
+# 문장 부호 없이 끝나는 한국어 종결 어미 (뒤에 공백/이모지가 오면 문장 끝으로 판단)
+SENTENCE_FINAL_SYLLABLES = frozenset("다요죠네까")
+
+# 답글 앞에 붙는 머리말 (예: "답글: ...")
+LABEL_PATTERN = re.compile(r'^\s*(?:답글|답변|Reply)\s*[:：]\s*')
+QUOTE_CHARS = '"\'“”‘’「」'
+
+
+def _is_emoji_start(cp: int) -> bool:
+    """이모지로 시작하는 코드 포인트 여부"""
+    return (
+        0x1F000 <= cp <= 0x1FAFF
+        or 0x2600 <= cp <= 0x27BF
+        or 0x2300 <= cp <= 0x23FF
+        or 0x2B00 <= cp <= 0x2BFF
+        or cp in (0x3030, 0x303D, 0x3297, 0x3299)
+    )
+
+
+def _is_extender(cp: int, ch: str) -> bool:
+    """앞 글자에 결합되는 코드 포인트 여부 (결합 문자, 이모지 수식자, 한글 중성/종성 자모)"""
+    if cp < 0x300:
+        return False
+    return (
+        0xFE00 <= cp <= 0xFE0F            # 이체자 선택자
+        or 0x1F3FB <= cp <= 0x1F3FF       # 피부색 수식자
+        or 0xE0020 <= cp <= 0xE007F       # 태그 문자
+        or cp == 0x20E3                   # 키캡
+        or 0x1160 <= cp <= 0x11FF         # 한글 중성/종성 자모
+        or 0xD7B0 <= cp <= 0xD7FF
+        or unicodedata.category(ch)[0] == "M"
+    )
+
+
+class _PhraseMatcher:
+    """여러 문구를 한 번의 순회로 찾는 Aho-Corasick 자동자"""
+
+    def __init__(self, phrases: Iterable[Tuple[str, str]]):
+        # phrases: (종류, 문구) - 종류는 "keyword" 또는 "forbidden"
+        self.goto = [{}]
+        self.fail = [0]
+        self.outputs = [()]
+        for kind, phrase in phrases:
+            if not phrase:
+                continue
+            state = 0
+            for ch in phrase:
+                if ch not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.outputs.append(())
+                    self.goto[state][ch] = len(self.goto) - 1
+                state = self.goto[state][ch]
+            self.outputs[state] += ((kind, phrase),)
+
+        # 실패 링크 (너비 우선, 루트의 자식은 루트로)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(ch, 0)
+                self.outputs[next_state] += self.outputs[self.fail[next_state]]
+
+
+class ReplyValidator:
+    """답글 규칙 검증 및 로컬 수정
+
+    규칙별 범위: (허용 최소, 허용 최대, 권장 최소, 권장 최대)
+    허용 범위를 벗어나면 위반, 권장 범위 안이면 만점
+    """
+
+    LENGTH_RANGE = (40, 150, 80, 120)
+    EMOJI_RANGE = (1, 2, 1, 2)
+    # 이모지가 없는 답글에 채워 넣는 기본 이모지
+    FILL_EMOJI = "😊"
+    SENTENCE_RANGE = (2, 4, 2, 3)
+    # 키워드가 주어지면 1개 이상 포함해야 함
+    MIN_KEYWORDS = 1
+
+    # 답글에 들어가면 안 되는 표현 (메타 설명, 가벼운 표현)
+    FORBIDDEN_PHRASES = [
+        "AI", "인공지능", "언어 모델", "답글 작성", "부가 설명", "리뷰 분석", "고객 리뷰:",
+        "ㅋㅋ", "ㅎㅎ", "#",
+    ]
+
+    # 키워드 조합별 문구 검색기 캐시 크기
+    MATCHER_CACHE_SIZE = 256
+
+    def __init__(self, forbidden_phrases: List[str] = None):
+        self.forbidden_phrases = list(forbidden_phrases if forbidden_phrases is not None else self.FORBIDDEN_PHRASES)
+        self._matchers = {}
+
+    def _matcher(self, keywords: Tuple[str, ...]) -> _PhraseMatcher:
+        matcher = self._matchers.get(keywords)
+        if matcher is None:
+            if len(self._matchers) >= self.MATCHER_CACHE_SIZE:
+                self._matchers.clear()
+            phrases = [("forbidden", p) for p in self.forbidden_phrases]
+            phrases += [("keyword", k) for k in keywords]
+            matcher = self._matchers[keywords] = _PhraseMatcher(phrases)
+        return matcher
+
+    @staticmethod
+    def clean(reply: str) -> str:
+        """앞뒤 공백, 감싼 따옴표, "답글:" 머리말 제거"""
+        reply = LABEL_PATTERN.sub("", reply.strip())
+        if len(reply) >= 2 and reply[0] in QUOTE_CHARS and reply[-1] in QUOTE_CHARS:
+            # 따옴표 안에 머리말이 있는 경우 ("답글: ...")
+            reply = LABEL_PATTERN.sub("", reply[1:-1].strip())
+        return reply
+
+    def validate(self, reply: str, keywords: Iterable[str] = ()) -> Dict:
+        """한 번의 순회로 모든 규칙 검사
+
+        반환: {"passed", "score", "violations", "length", "emoji_count", "sentence_count",
+               "keywords_found", "keywords_missing", "forbidden_found",
+               "emoji_spans": [(시작, 끝)], "sentence_ends": [(끝 위치, 누적 글자 수)]}
+        """
+        keywords = tuple(dict.fromkeys(k for k in keywords if k))
+        matcher = self._matcher(keywords)
+        goto, fail, outputs = matcher.goto, matcher.fail, matcher.outputs
+
+        matched = set()
+        state = 0
+        length = 0
+        emoji_spans = []
+        sentence_ends = []
+
+        cluster_start = 0
+        cluster_kind = None      # "space", "punct", "emoji", "text"
+        cluster_first = ""
+        regional_count = 0
+        join_next = False
+
+        in_sentence = False      # 마지막 문장 경계 이후 본문이 있었는지
+        pending_end = None       # 다음 본문이 나오면 확정할 문장 끝 (끝 위치, 누적 글자 수)
+        last_text = ""           # 마지막 본문 글자
+        before_last_text = ""    # 그 앞 글자
+
+        # 끝에 가상의 공백을 두어 마지막 글자 묶음도 같은 방식으로 마무리
+        for i, ch in enumerate(reply + " "):
+            is_sentinel = i == len(reply)
+            cp = ord(ch)
+
+            if not is_sentinel:
+                # 문구 검색 (Aho-Corasick)
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(ch, 0)
+                if outputs[state]:
+                    matched.update(outputs[state])
+
+            # 새 글자 묶음의 종류 (대부분인 한글 음절/공백은 바로 판정)
+            if 0xAC00 <= cp <= 0xD7A3:
+                new_kind = "text"
+            elif cp == 0x20:
+                new_kind = "space"
+            else:
+                # 앞 글자 묶음에 결합되는 글자
+                if i and (join_next or _is_extender(cp, ch)
+                          or (0x1F1E6 <= cp <= 0x1F1FF and regional_count == 1)):
+                    join_next = cp == 0x200D
+                    if cp in (0xFE0F, 0x20E3):
+                        cluster_kind = "emoji"
+                    if 0x1F1E6 <= cp <= 0x1F1FF:
+                        regional_count += 1
+                    continue
+                if cp == 0x200D and i:
+                    join_next = True
+                    continue
+                if ch.isspace():
+                    new_kind = "space"
+                elif _is_emoji_start(cp):
+                    new_kind = "emoji"
+                elif ch in TERMINAL_PUNCTUATION or unicodedata.category(ch)[0] == "P":
+                    new_kind = "punct"
+                else:
+                    new_kind = "text"
+
+            # 이전 글자 묶음 마무리
+            if cluster_kind == "text":
+                if pending_end is not None:
+                    sentence_ends.append(pending_end)
+                    pending_end = None
+                in_sentence = True
+                before_last_text, last_text = last_text, cluster_first
+            elif cluster_kind == "space":
+                if (pending_end is None and in_sentence and last_text in SENTENCE_FINAL_SYLLABLES
+                        and "가" <= before_last_text <= "힣"):
+                    pending_end = (cluster_start, length - 1)
+            elif cluster_kind == "emoji":
+                emoji_spans.append((cluster_start, i))
+                if pending_end is not None:
+                    # 문장 부호 뒤의 이모지는 앞 문장에 포함
+                    pending_end = (i, length)
+                elif in_sentence and last_text in SENTENCE_FINAL_SYLLABLES and "가" <= before_last_text <= "힣":
+                    pending_end = (i, length)
+            elif cluster_kind == "punct":
+                # 문장 끝 뒤의 닫는 괄호/따옴표도 앞 문장에 포함
+                if pending_end is not None or (cluster_first in TERMINAL_PUNCTUATION and in_sentence):
+                    pending_end = (i, length)
+            if pending_end is not None and cluster_kind in ("emoji", "punct"):
+                in_sentence = False
+
+            if is_sentinel:
+                break
+
+            # 새 글자 묶음 시작
+            length += 1
+            cluster_start = i
+            cluster_first = ch
+            cluster_kind = new_kind
+            regional_count = 1 if 0x1F1E6 <= cp <= 0x1F1FF else 0
+            join_next = False
+
+        # 마지막 문장 (문장 부호 없이 끝나도 포함)
+        if pending_end is not None:
+            sentence_ends.append(pending_end)
+        elif in_sentence:
+            sentence_ends.append((len(reply.rstrip()), length))
+
+        keywords_found = [k for k in keywords if ("keyword", k) in matched]
+        report = {
+            "length": length,
+            "emoji_count": len(emoji_spans),
+            "sentence_count": len(sentence_ends),
+            "keywords_found": keywords_found,
+            "keywords_missing": [k for k in keywords if k not in keywords_found],
+            "forbidden_found": sorted({phrase for kind, phrase in matched if kind == "forbidden"}),
+            "emoji_spans": emoji_spans,
+            "sentence_ends": sentence_ends,
+        }
+        return self._score(report, bool(keywords))
+
+    def _score(self, report: Dict, has_keywords: bool) -> Dict:
+        """규칙별 판정 및 점수 (권장 범위 1점, 허용 범위 0.5점, 위반 0점의 평균)"""
+        checks = {
+            "length": self._range_score(report["length"], self.LENGTH_RANGE),
+            "emoji": self._range_score(report["emoji_count"], self.EMOJI_RANGE),
+            "sentences": self._range_score(report["sentence_count"], self.SENTENCE_RANGE),
+            "forbidden": 0.0 if report["forbidden_found"] else 1.0,
+        }
+        if has_keywords:
+            checks["keywords"] = 1.0 if len(report["keywords_found"]) >= self.MIN_KEYWORDS else 0.0
+
+        report["violations"] = [rule for rule, score in checks.items() if score == 0.0]
+        report["passed"] = not report["violations"]
+        report["score"] = round(sum(checks.values()) / len(checks), 3)
+        return report
+
+    @staticmethod
+    def _range_score(value: int, limits: Tuple[int, int, int, int]) -> float:
+        low, high, ideal_low, ideal_high = limits
+        if ideal_low <= value <= ideal_high:
+            return 1.0
+        if low <= value <= high:
+            return 0.5
+        return 0.0
+
+    def fix(
+        self,
+        reply: str,
+        report: Dict,
+        keywords: Iterable[str] = (),
+        fill_emoji: str = None
+    ) -> Tuple[str, Dict]:
+        """로컬에서 고칠 수 있는 위반 수정 후 다시 검증
+
+        - 이모지 초과: 앞쪽 이모지만 남기고 제거
+        - 이모지 없음: 첫 문장 끝에 fill_emoji(기본 FILL_EMOJI) 추가 (문장 단위로 줄여도 남도록)
+        - 길이/문장 수 초과: 문장 단위로 뒤에서부터 제거 (문장 중간은 자르지 않음)
+        짧은 답글, 키워드 누락, 금지 표현은 재생성이 필요하므로 그대로 반환
+        """
+        keywords = tuple(keywords)
+        max_emoji = self.EMOJI_RANGE[1]
+        if report["emoji_count"] > max_emoji:
+            for start, end in reversed(report["emoji_spans"][max_emoji:]):
+                reply = reply[:start] + reply[end:]
+            reply = re.sub(r' {2,}', ' ', reply).strip()
+            report = self.validate(reply, keywords)
+
+        reply, report = self._trim_sentences(reply, report, keywords)
+
+        # 줄인 뒤에 이모지가 없으면 첫 문장 끝에 추가 (길이를 넘으면 다시 줄여도 첫 문장은 유지)
+        if report["emoji_count"] < self.EMOJI_RANGE[0] and reply:
+            end = report["sentence_ends"][0][0] if report["sentence_ends"] else len(reply)
+            reply = f"{reply[:end].rstrip()} {fill_emoji or self.FILL_EMOJI}{reply[end:]}"
+            report = self.validate(reply, keywords)
+            reply, report = self._trim_sentences(reply, report, keywords)
+
+        return reply, report
+
+    def _trim_sentences(self, reply: str, report: Dict, keywords: Tuple[str, ...]) -> Tuple[str, Dict]:
+        """길이/문장 수 초과 시 허용 범위 안에서 가장 많은 문장 유지"""
+        max_length = self.LENGTH_RANGE[1]
+        max_sentences = self.SENTENCE_RANGE[1]
+        if report["length"] <= max_length and report["sentence_count"] <= max_sentences:
+            return reply, report
+        cut = None
+        for count, (end, graphemes) in enumerate(report["sentence_ends"], 1):
+            if count > max_sentences or graphemes > max_length:
+                break
+            cut = end
+        if cut is None:
+            return reply, report
+        reply = reply[:cut].rstrip()
+        return reply, self.validate(reply, keywords)
+
+    def feedback(self, report: Dict) -> str:
+        """재생성 요청 문구 (위반 규칙 설명)"""
+        length_low, length_high = self.LENGTH_RANGE[2], self.LENGTH_RANGE[3]
+        sentence_low, sentence_high = self.SENTENCE_RANGE[2], self.SENTENCE_RANGE[3]
+        reasons = {
+            "length": f"길이 {report['length']}자 ({length_low}-{length_high}자 필요)",
+            "emoji": f"이모지 {report['emoji_count']}개 ({self.EMOJI_RANGE[0]}-{self.EMOJI_RANGE[1]}개 필요)",
+            "sentences": f"문장 {report['sentence_count']}개 ({sentence_low}-{sentence_high}문장 필요)",
+            "forbidden": f"사용 금지 표현 포함 ({', '.join(report['forbidden_found'])})",
+            "keywords": f"고객 키워드 미포함 ({', '.join(report['keywords_missing'])} 중 1개 이상 필요)",
+        }
+        details = ", ".join(reasons[rule] for rule in report["violations"])
+        return f"이 답글은 작성 규칙에 맞지 않습니다: {details}. 규칙에 맞게 다시 작성하세요 (답글만):"
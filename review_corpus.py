@@ -0,0 +1,156 @@
+"""
+합성 한국어 리뷰 코퍼스 생성기
+시드 고정으로 재현 가능한 감정 라벨 리뷰를 생성 (길이, 이모지, 부정 표현, 혼합 감정 포함)
+"""
+
+from typing import Dict, Iterator, List
+import json
+import random
+
+
+ASPECTS = ["커피", "음식", "디저트", "빵", "직원분들", "사장님", "분위기", "인테리어", "가격", "매장", "화장실", "주차", "음악", "좌석"]
+
+# 절 템플릿 - 긍정/부정 절은 리뷰 점수에 +1/-1, 중립 절은 0
+POSITIVE_CLAUSES = [
+    "{aspect} 정말 맛있었어요", "{aspect} 너무 친절하셨어요", "{aspect} 깨끗하고 좋았습니다",
+    "{aspect} 최고예요", "{aspect} 완벽했어요", "{aspect} 만족스러웠어요", "{aspect} 훌륭했습니다",
+    "{aspect} 추천합니다", "{aspect} 마음에 들었어요", "{aspect} 감사했어요",
+]
+NEGATIVE_CLAUSES = [
+    "{aspect} 별로였어요", "{aspect} 실망스러웠어요", "{aspect} 불친절했어요", "{aspect} 맛없었어요",
+    "{aspect} 더러웠어요", "{aspect} 최악이었어요", "{aspect} 불만이 많았어요", "{aspect} 짜증났어요",
+    "{aspect} 후회했어요", "{aspect} 너무 비쌌어요",
+]
+# 부정어가 붙어 극성이 반대가 되는 표현 (키워드 기반 분석이 틀리기 쉬운 경우)
+NEGATED_POSITIVE_CLAUSES = [
+    "{aspect} 맛있지 않았어요", "{aspect} 친절하지 않았어요", "{aspect} 깨끗하지 않았어요",
+    "{aspect} 좋지는 않았어요", "{aspect} 추천하고 싶지 않아요", "{aspect} 만족스럽지 못했어요",
+]
+NEGATED_NEGATIVE_CLAUSES = [
+    "{aspect} 별로이지 않았어요", "{aspect} 나쁘지 않았어요", "{aspect} 불만은 없었어요",
+    "{aspect} 실망스럽지 않았어요", "{aspect} 후회 없어요",
+]
+NEUTRAL_CLAUSES = [
+    "{aspect} 평범했어요", "{aspect} 그냥 그랬어요", "{aspect} 무난했어요",
+    "{aspect} 보통이었어요", "오늘 {aspect} 때문에 방문했어요", "{aspect} 괜찮은 편이에요",
+]
+
+OPENERS = ["", "", "", "오랜만에 방문했어요. ", "친구랑 다녀왔어요. ", "점심에 들렀어요. ", "처음 와봤는데요, "]
+CLOSERS = ["", "", "", " 또 올게요.", " 다음에 또 방문할게요.", " 참고하세요.", " 수고하세요."]
+POSITIVE_EMOJI = ["😊", "👍", "❤️", "😍", "🥰", "✨"]
+NEGATIVE_EMOJI = ["😡", "😞", "👎", "😤", "😢"]
+NEUTRAL_EMOJI = ["🙂", "😐", "☕"]
+CONJUNCTIONS = [" ", " 그리고 ", ", ", "지만 "]
+
+
+def _with_particle(word: str, rng: random.Random) -> str:
+    """받침 유무에 맞는 조사 붙이기 (이/가, 은/는, 도, 없음)"""
+    last = word[-1]
+    has_final = "가" <= last <= "힣" and (ord(last) - ord("가")) % 28 != 0
+    kind = rng.choice(["subject", "topic", "also", "none"])
+    if kind == "subject":
+        return word + ("이" if has_final else "가")
+    if kind == "topic":
+        return word + ("은" if has_final else "는")
+    if kind == "also":
+        return word + "도"
+    return word
+
+
+def _label(score: int) -> str:
+    if score > 0:
+        return "positive"
+    if score < 0:
+        return "negative"
+    return "neutral"
+
+
+def generate_review(rng: random.Random) -> Dict:
+    """리뷰 1건 생성: {"text", "label", "negated", "mixed", "has_emoji"}"""
+    clause_count = rng.choices([1, 2, 3, 4, 6], weights=[30, 30, 20, 12, 8])[0]
+    score = 0
+    polarities = []
+    negated = False
+    clauses = []
+
+    for _ in range(clause_count):
+        aspect = _with_particle(rng.choice(ASPECTS), rng)
+        kind = rng.choices(
+            ["positive", "negative", "neg_positive", "neg_negative", "neutral"],
+            weights=[38, 28, 8, 6, 20]
+        )[0]
+        if kind == "positive":
+            template, polarity = rng.choice(POSITIVE_CLAUSES), 1
+        elif kind == "negative":
+            template, polarity = rng.choice(NEGATIVE_CLAUSES), -1
+        elif kind == "neg_positive":
+            template, polarity = rng.choice(NEGATED_POSITIVE_CLAUSES), -1
+            negated = True
+        elif kind == "neg_negative":
+            template, polarity = rng.choice(NEGATED_NEGATIVE_CLAUSES), 1
+            negated = True
+        else:
+            template, polarity = rng.choice(NEUTRAL_CLAUSES), 0
+
+        clause = template.format(aspect=aspect).strip()
+        score += polarity
+        if polarity:
+            polarities.append(polarity)
+        clauses.append(clause)
+
+    text = rng.choice(OPENERS)
+    for i, clause in enumerate(clauses):
+        if i == 0:
+            text += clause
+        else:
+            conjunction = rng.choice(CONJUNCTIONS)
+            if conjunction == "지만 ":
+                # "~었어요" 어미만 "~었지만"으로 연결, 그 외에는 쉼표로 연결
+                if text.endswith("었어요"):
+                    text = text[:-2] + "지만 " + clause
+                else:
+                    text += ", " + clause
+            else:
+                text += ("." if conjunction == " " else "") + conjunction + clause
+    text += rng.choice([".", "!", "!!", "~", ""]) + rng.choice(CLOSERS)
+
+    label = _label(score)
+    has_emoji = rng.random() < 0.35
+    if has_emoji:
+        pool = {"positive": POSITIVE_EMOJI, "negative": NEGATIVE_EMOJI}.get(label, NEUTRAL_EMOJI)
+        text += " " + "".join(rng.choice(pool) for _ in range(rng.randint(1, 3)))
+
+    return {
+        "text": text.strip(),
+        "label": label,
+        "negated": negated,
+        "mixed": 1 in polarities and -1 in polarities,
+        "has_emoji": has_emoji
+    }
+
+
+def iter_corpus(size: int = 100_000, seed: int = 42) -> Iterator[Dict]:
+    """시드 고정 코퍼스 순회"""
+    rng = random.Random(seed)
+    for _ in range(size):
+        yield generate_review(rng)
+
+
+def generate_corpus(size: int = 100_000, seed: int = 42) -> List[Dict]:
+    """시드 고정 코퍼스 생성"""
+    return list(iter_corpus(size, seed))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="합성 한국어 리뷰 코퍼스 생성 (JSONL)")
+    parser.add_argument("--size", type=int, default=100_000, help="리뷰 수 (기본 100,000)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (기본 42)")
+    parser.add_argument("--output", default="review_corpus.jsonl", help="출력 파일")
+    args = parser.parse_args()
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        for review in iter_corpus(args.size, args.seed):
+            f.write(json.dumps(review, ensure_ascii=False) + "\n")
+    print(f"{args.size}개 리뷰를 {args.output}에 저장했습니다.")
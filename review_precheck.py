@@ -0,0 +1,149 @@
+"""
+새 리뷰 사전 확인
+리뷰 목록 전체를 확인하기 전에 적은 비용으로 할 일이 없는 실행을 판별
+1. 대시보드: 리뷰 메뉴의 미답변 리뷰 수 표시가 0이면 리뷰 페이지로 이동하지 않고 종료
+   (표시가 없거나 여러 개라 어느 것인지 알 수 없으면 리뷰 페이지에서 확인)
+2. 리뷰 페이지: 최신 리뷰 N개의 지문이 지난 실행과 같고 지난 실행에서 남은 리뷰가 없었으면 종료
+   (리뷰별 식별값 + 내용 + 작성일, 사진만 있는 리뷰가 같은 날 여러 개여도 구분)
+
+업체별 지문은 review_precheck.json에 저장
+    {업체명: {"fingerprint", "pending", "saved_at"}}
+"""
+
+from typing import Dict, Optional
+import hashlib
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+
+STATE_FILE = "review_precheck.json"
+
+# 리뷰 메뉴(리뷰 버튼과 같은 요소) 안에서만 미답변 리뷰 수 찾기
+# 문구(예: "미답변 3", "답글 대기 0건")가 있으면 문구, 없으면 숫자만 있는 배지 요소를 모두 반환
+DASHBOARD_COUNT_SCRIPT = """
+const roots = [];
+document.querySelectorAll('li#REVIEWS, a[data-area-code="gnb.review"]').forEach(node => {
+    if (!roots.some(root => root.contains(node))) roots.push(node);
+});
+const pattern = /(미답변|답글\\s*대기|답글\\s*미작성|답글을\\s*기다리는)\\s*(?:리뷰)?\\s*(\\d+)\\s*(?:건|개)?/g;
+const labelled = [];
+const badges = [];
+for (const root of roots) {
+    const text = (root.innerText || "").replace(/\\s+/g, " ");
+    for (const match of text.matchAll(pattern)) {
+        labelled.push({label: match[1], count: parseInt(match[2], 10)});
+    }
+    const counted = [];
+    root.querySelectorAll('[class*="badge" i]').forEach(badge => {
+        const value = (badge.innerText || "").trim();
+        if (!/^\\d+$/.test(value) || counted.some(node => node.contains(badge))) return;
+        counted.push(badge);
+        badges.push({label: "배지", count: parseInt(value, 10)});
+    });
+}
+return labelled.length ? labelled : badges;
+"""
+
+# 최신 리뷰 N개의 식별 정보 (답글 여부와 무관하게 유지되는 부분만)
+# 식별값: 리뷰 요소의 id/data-* 속성과 링크 경로/쿼리 중 숫자가 포함된 값, 없으면 작성자 + 방문 차수
+NEWEST_REVIEWS_SCRIPT = """
+const size = arguments[0];
+const identify = li => {
+    const values = [];
+    const add = value => {
+        value = String(value || "").trim();
+        if (/^[\\w-]{4,}$/.test(value) && /\\d/.test(value)) values.push(value);
+    };
+    for (const attr of li.attributes) {
+        if (attr.name === "id" || (attr.name.startsWith("data-") && attr.name !== "data-area-code")) add(attr.value);
+    }
+    li.querySelectorAll("a[href]").forEach(link => {
+        try {
+            const url = new URL(link.getAttribute("href"), location.href);
+            url.pathname.split("/").forEach(add);
+            url.searchParams.forEach(add);
+        } catch (e) {}
+    });
+    if (values.length) return values.join(",");
+    const author = (li.innerText || "").split("\\n").map(line => line.trim()).find(Boolean) || "";
+    const visit = (li.innerText || "").match(/(\\d+)\\s*번째\\s*방문/);
+    return author + "#" + (visit ? visit[1] : "");
+};
+return Array.from(document.querySelectorAll('li.Review_pui_review__zhZdn')).slice(0, size).map(li => {
+    const text = li.querySelector('a[data-pui-click-code="text"]');
+    const date = (li.innerText || "").match(/\\d{2,4}\\.\\s?\\d{1,2}\\.\\s?\\d{1,2}/);
+    return [identify(li), text ? text.innerText.trim() : "", date ? date[0] : ""].join("|");
+});
+"""
+
+
+def read_dashboard_count(driver) -> Optional[int]:
+    """대시보드 리뷰 메뉴의 미답변 리뷰 수 (표시가 없거나 여러 개면 None)"""
+    try:
+        found = driver.execute_script(DASHBOARD_COUNT_SCRIPT)
+    except Exception as e:
+        logger.debug("대시보드 미답변 수 확인 실패: %s", e)
+        return None
+    if not found:
+        return None
+    if len(found) > 1:
+        logger.debug("대시보드 미답변 수 표시가 여러 개라 사용하지 않습니다: %s",
+                     ", ".join(f"{item['label']} {item['count']}" for item in found))
+        return None
+    logger.debug("대시보드 '%s' 표시: %s", found[0]["label"], found[0]["count"])
+    return found[0]["count"]
+
+
+def newest_fingerprint(driver, size: int = 5) -> Optional[str]:
+    """최신 리뷰 size개의 지문 (리뷰가 없으면 None)"""
+    try:
+        keys = driver.execute_script(NEWEST_REVIEWS_SCRIPT, size)
+    except Exception as e:
+        logger.debug("최신 리뷰 지문 계산 실패: %s", e)
+        return None
+    if not keys:
+        return None
+    return hashlib.sha1("\n".join(keys).encode("utf-8")).hexdigest()
+
+
+class PrecheckState:
+    """업체별 최신 리뷰 지문 저장소"""
+
+    def __init__(self, path: str = STATE_FILE):
+        self.path = path
+        self.entries: Dict[str, Dict] = self._load()
+
+    def unchanged(self, business: str, fingerprint: Optional[str]) -> bool:
+        """지난 실행과 최신 리뷰가 같고 남은 리뷰가 없었으면 True"""
+        entry = self.entries.get(business)
+        return bool(fingerprint) and entry is not None \
+            and entry.get("fingerprint") == fingerprint and entry.get("pending") == 0
+
+    def record(self, business: str, fingerprint: Optional[str], pending: int):
+        """실행 결과 저장 (pending: 이번 실행 후 남은/실패한 리뷰 수)"""
+        if not fingerprint:
+            return
+        self.entries[business] = {
+            "fingerprint": fingerprint,
+            "pending": pending,
+            "saved_at": time.strftime("%Y-%m-%d %H:%M:%S")
+        }
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            logger.warning("사전 확인 상태 저장 실패: %s", e)
+
+    def _load(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("사전 확인 상태 파일을 읽지 못했습니다: %s", e)
+            return {}
@@ -0,0 +1,75 @@
+"""
+유사 리뷰 검색 인덱스
+과거 (리뷰, 게시된 답글) 쌍을 문자 n-gram 해시 벡터로 저장하고
+새 리뷰와 가장 비슷한 리뷰 top-k를 행렬 연산 한 번으로 검색
+"""
+
+from typing import Dict, List, Tuple
+import json
+import os
+
+import numpy as np
+
+from text_vectors import DEFAULT_DIM, hashed_ngram_vector
+
+
+class ReviewRetrievalIndex:
+    """리뷰-답글 쌍 검색 인덱스 (쌍은 JSONL 파일에 저장, 벡터는 로드 시 재계산)"""
+
+    def __init__(self, pairs_file: str = "review_pairs.jsonl", dim: int = DEFAULT_DIM):
+        self.pairs_file = pairs_file
+        self.dim = dim
+        self.pairs = []
+        self._matrix = np.zeros((256, dim), dtype=np.float32)
+
+        pairs_dir = os.path.dirname(pairs_file)
+        if pairs_dir:
+            os.makedirs(pairs_dir, exist_ok=True)
+
+        if os.path.exists(pairs_file):
+            with open(pairs_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        pair = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self._append(pair)
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def _append(self, pair: Dict):
+        """메모리 인덱스에 쌍 추가 (저장 공간 부족 시 두 배 확장)"""
+        count = len(self.pairs)
+        if count >= self._matrix.shape[0]:
+            grown = np.zeros((self._matrix.shape[0] * 2, self.dim), dtype=np.float32)
+            grown[:count] = self._matrix[:count]
+            self._matrix = grown
+
+        self._matrix[count] = hashed_ngram_vector(pair["review"], self.dim)
+        self.pairs.append(pair)
+
+    def add(self, review: str, reply: str):
+        """게시된 리뷰-답글 쌍 추가 (파일에 이어 쓰기)"""
+        if not review.strip():
+            return
+        pair = {"review": review, "reply": reply}
+        with open(self.pairs_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(pair, ensure_ascii=False) + "\n")
+        self._append(pair)
+
+    def search(self, review: str, top_k: int = 3) -> List[Tuple[float, Dict]]:
+        """비슷한 리뷰 top-k 검색, (유사도, 쌍) 목록을 유사도 내림차순으로 반환"""
+        count = len(self.pairs)
+        if count == 0 or not review.strip():
+            return []
+
+        sims = self._matrix[:count] @ hashed_ngram_vector(review, self.dim)
+        top_k = min(top_k, count)
+        # 전체 정렬 대신 상위 k개만 선택 후 정렬
+        top = np.argpartition(-sims, top_k - 1)[:top_k]
+        top = top[np.argsort(-sims[top])]
+        return [(float(sims[i]), self.pairs[i]) for i in top]
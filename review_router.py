@@ -0,0 +1,53 @@
+"""
+리뷰 복잡도 기반 생성 등급 분류
+리뷰 길이, 감정 강도, 내용에 따라 답글 생성 등급(tier)을 결정
+"""
+
+from typing import Dict
+
+
+# 생성 등급
+TIER_PHOTO = "photo"        # 텍스트 없는 사진 리뷰 → 템플릿
+TIER_FAST = "fast"          # 짧은 단순 리뷰 → 로컬 모델 또는 템플릿
+TIER_STANDARD = "standard"  # 일반 리뷰 → 기본 모델
+TIER_STRONG = "strong"      # 부정/장문 리뷰 → 최상위 모델
+
+TIERS = (TIER_PHOTO, TIER_FAST, TIER_STANDARD, TIER_STRONG)
+
+
+class ReviewRouter:
+    """리뷰 생성 등급 분류기"""
+
+    # 이 길이 이하의 부정이 아닌 리뷰는 단순 리뷰 ("굿", "맛있어요" 등)
+    TRIVIAL_MAX_LENGTH = 15
+    # 이 길이 이상이면 장문 리뷰
+    LONG_MIN_LENGTH = 150
+    # 이 강도 이상의 긍정 리뷰는 단순 리뷰 길이 기준을 두 배로 완화
+    STRONG_POSITIVE = 0.7
+
+    # 짧아도 구체적인 응답이 필요한 내용 (질문, 요청)
+    REQUEST_MARKERS = ["?", "문의", "예약", "주차", "가격", "환불", "언제", "어떻게", "가능"]
+
+    def route(self, review_content: str, analysis_result: Dict) -> str:
+        """리뷰의 생성 등급 반환"""
+        text = review_content.strip()
+        length = len(text)
+        sentiment = analysis_result.get("sentiment", "neutral")
+        strength = analysis_result.get("sentiment_strength", 0.5)
+
+        if not text:
+            return TIER_PHOTO
+
+        if sentiment == "negative" or length >= self.LONG_MIN_LENGTH:
+            return TIER_STRONG
+
+        if any(marker in text for marker in self.REQUEST_MARKERS):
+            return TIER_STANDARD
+
+        trivial_length = self.TRIVIAL_MAX_LENGTH
+        if sentiment == "positive" and strength >= self.STRONG_POSITIVE:
+            trivial_length *= 2
+        if length <= trivial_length:
+            return TIER_FAST
+
+        return TIER_STANDARD
@@ -0,0 +1,86 @@
+"""
+리뷰 답글 우선순위 스케줄러
+답글 대기 리뷰를 감정(부정 우선), 감정 강도, 최신순, 리뷰 길이로 정렬하고
+실행 시간/답글 수 한도에 도달하면 남은 리뷰는 다음 실행으로 넘김
+"""
+
+from typing import Dict, Optional
+from datetime import date
+import heapq
+import re
+import time
+
+
+# 감정별 우선순위 (작을수록 먼저)
+SENTIMENT_PRIORITY = {"negative": 0, "neutral": 1, "positive": 2}
+
+# 리뷰 날짜 표기 (예: 2025.11.07, 25.11.7.)
+DATE_PATTERN = re.compile(r'(\d{4}|\d{2})\.\s?(\d{1,2})\.\s?(\d{1,2})')
+
+
+def parse_review_date(text: str) -> Optional[date]:
+    """리뷰 영역 텍스트에서 첫 번째 날짜 추출 (없으면 None)"""
+    match = DATE_PATTERN.search(text or "")
+    if not match:
+        return None
+    year, month, day = (int(part) for part in match.groups())
+    if year < 100:
+        year += 2000
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+class ReviewQueue:
+    """답글 대기 리뷰 우선순위 큐
+
+    항목은 dict: {"position": 목록 순서, "text": 리뷰 내용, "date": 작성일(선택),
+                  "analysis": 감정 분석 결과, ...}
+    """
+
+    def __init__(self):
+        self._heap = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @staticmethod
+    def priority(item: Dict) -> tuple:
+        """우선순위 키 (부정 우선 → 감정 강도 높은 순 → 최신순 → 긴 리뷰 우선, 모두 같으면 push에서 목록 순서)"""
+        analysis = item["analysis"]
+        review_date = item.get("date")
+        return (
+            SENTIMENT_PRIORITY.get(analysis["sentiment"], 1),
+            -analysis.get("sentiment_strength", 0.5),
+            -review_date.toordinal() if review_date else 0,
+            -len(item["text"])
+        )
+
+    def push(self, item: Dict):
+        # position은 리뷰마다 달라 키가 같아 dict를 비교하는 일이 없음
+        heapq.heappush(self._heap, (self.priority(item), item["position"], item))
+
+    def pop(self) -> Dict:
+        return heapq.heappop(self._heap)[2]
+
+
+class RunBudget:
+    """실행당 시간/답글 수 한도 (0 또는 None이면 제한 없음)"""
+
+    def __init__(self, max_seconds: Optional[float] = None, max_replies: Optional[int] = None):
+        self.max_seconds = max_seconds or None
+        self.max_replies = max_replies or None
+        self.started_at = time.time()
+        self.replied = 0
+
+    def elapsed(self) -> float:
+        return time.time() - self.started_at
+
+    def exhausted_reason(self, next_estimate_seconds: float = 0.0) -> Optional[str]:
+        """한도 도달 사유 (다음 리뷰까지 처리하면 시간을 넘길 것으로 예상되면 미리 중단)"""
+        if self.max_replies is not None and self.replied >= self.max_replies:
+            return f"답글 수 한도 도달 ({self.replied}/{self.max_replies}개)"
+        if self.max_seconds is not None and self.elapsed() + next_estimate_seconds > self.max_seconds:
+            return f"실행 시간 한도 도달 ({self.elapsed():.0f}/{self.max_seconds:.0f}초)"
+        return None
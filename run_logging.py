@@ -0,0 +1,190 @@
+"""
+구조화 로그 파이프라인
+로그 기록은 큐에 넣기만 하고 백그라운드 스레드가 콘솔(사람용 형식)과 JSONL 파일에 출력
+(콘솔이 느리거나 출력이 파이프로 연결되어도 자동화가 멈추지 않음)
+
+JSONL 항목: {"ts", "level", "logger", "message", "run_id", "business", "review_id", "phase", "duration_ms"}
+"""
+
+from typing import Dict, Optional
+from datetime import datetime
+import contextlib
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+import uuid
+
+
+# 로그 항목에 붙는 실행 정보 필드
+CONTEXT_FIELDS = ("run_id", "business", "review_id", "phase", "duration_ms")
+
+# 기본 로그 레벨을 낮춰 둘 외부 라이브러리 (log_module_levels로 변경 가능)
+NOISY_LOGGERS = {"selenium": "WARNING", "urllib3": "WARNING", "WDM": "WARNING", "httpx": "WARNING", "openai": "WARNING"}
+
+# 실행 단위 정보 (run_id, business) - 작업 스레드와 GUI 스레드가 공유
+_run_fields: Dict = {}
+# 리뷰/단계 정보 - 기록하는 스레드의 컨텍스트 기준
+_context = contextvars.ContextVar("log_context", default={})
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+
+
+class ContextFilter(logging.Filter):
+    """기록 시점의 실행/리뷰/단계 정보를 로그 항목에 추가 (extra로 넘긴 값이 우선)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        fields = {**_run_fields, **_context.get()}
+        for name in CONTEXT_FIELDS:
+            if not hasattr(record, name):
+                setattr(record, name, fields.get(name))
+        return True
+
+
+class ConsoleFormatter(logging.Formatter):
+    """사람용 형식: 시각 레벨 [리뷰 n] 메시지 (소요 시간)"""
+
+    def __init__(self):
+        super().__init__(datefmt="%H:%M:%S")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = f"{self.formatTime(record, self.datefmt)} {record.levelname:<7} "
+        if record.review_id is not None:
+            line += f"[리뷰 {record.review_id}] "
+        line += record.getMessage()
+        if record.duration_ms is not None:
+            line += f" ({record.duration_ms / 1000:.2f}초)"
+        return line
+
+
+class JsonLineFormatter(logging.Formatter):
+    """JSONL 형식 (한 줄에 항목 하나)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for name in CONTEXT_FIELDS:
+            entry[name] = getattr(record, name, None)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def _level(value, default: int) -> int:
+    if isinstance(value, int):
+        return value
+    return logging.getLevelName(str(value).upper()) if value else default
+
+
+def setup_logging(
+    business: str = "",
+    log_dir: Optional[str] = "logs",
+    console_level="INFO",
+    file_level="INFO",
+    module_levels: Optional[Dict[str, str]] = None,
+    quiet: bool = False
+) -> str:
+    """로그 파이프라인 시작 (다시 호출하면 이전 파이프라인을 정리하고 새 실행으로 시작)
+
+    Args:
+        business: 업체명 (모든 항목에 기록)
+        log_dir: JSONL 로그 폴더 (None이면 파일 출력 안 함), 파일은 날짜별 naverplace-YYYY-MM-DD.jsonl
+        console_level / file_level: 출력별 최소 레벨
+        module_levels: 로거별 레벨 (예: {"ai_reply_generator": "WARNING", "reply_poster": "DEBUG"})
+        quiet: 콘솔에는 오류만 출력 (데몬 실행용, 파일 출력은 그대로)
+
+    Returns:
+        실행 ID
+    """
+    global _listener, _queue_handler
+    shutdown_logging()
+
+    run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    _run_fields.clear()
+    _run_fields.update({"run_id": run_id, "business": business})
+
+    module_levels = {name: _level(level, logging.INFO) for name, level in (module_levels or {}).items()}
+    console_level = logging.ERROR if quiet else _level(console_level, logging.INFO)
+    file_level = _level(file_level, logging.INFO)
+
+    # 로거 레벨이 전체 기준 (로거별 레벨로 낮춘 항목은 출력에서도 통과하도록 출력 레벨을 맞춤)
+    root = logging.getLogger()
+    root.setLevel(min(console_level, file_level))
+    for name, level in {**NOISY_LOGGERS, **module_levels}.items():
+        logging.getLogger(name).setLevel(_level(level, logging.INFO))
+    lowest_module_level = min(module_levels.values(), default=logging.CRITICAL)
+
+    handlers = []
+    # 콘솔 없는 실행(--windowed EXE)에서는 sys.stdout이 None
+    if sys.stdout is not None:
+        console = logging.StreamHandler(sys.stdout)
+        console.setLevel(console_level if quiet else min(console_level, lowest_module_level))
+        console.setFormatter(ConsoleFormatter())
+        handlers.append(console)
+
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+        log_file = os.path.join(log_dir, f"naverplace-{time.strftime('%Y-%m-%d')}.jsonl")
+        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler.setLevel(min(file_level, lowest_module_level))
+        file_handler.setFormatter(JsonLineFormatter())
+        handlers.append(file_handler)
+
+    _queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+    _queue_handler.addFilter(ContextFilter())
+    root.addHandler(_queue_handler)
+
+    # respect_handler_level: 출력별 레벨은 백그라운드 스레드에서 적용
+    _listener = logging.handlers.QueueListener(_queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return run_id
+
+
+def shutdown_logging():
+    """남은 로그를 모두 출력하고 파이프라인 정리"""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def set_phase(phase: str):
+    """현재 단계 설정 (이후 로그 항목에 기록)"""
+    _context.set({**_context.get(), "phase": phase})
+
+
+@contextlib.contextmanager
+def log_context(**fields):
+    """블록 안의 로그 항목에 필드 추가 (예: review_id)"""
+    token = _context.set({**_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+@contextlib.contextmanager
+def timed(logger: logging.Logger, phase: str, level: int = logging.DEBUG):
+    """블록 소요 시간을 duration_ms로 기록 (예외 시 실패로 기록 후 다시 발생)"""
+    started_at = time.perf_counter()
+    with log_context(phase=phase):
+        try:
+            yield
+        except Exception:
+            duration_ms = round((time.perf_counter() - started_at) * 1000, 1)
+            logger.log(level, "%s 실패", phase, extra={"duration_ms": duration_ms})
+            raise
+        duration_ms = round((time.perf_counter() - started_at) * 1000, 1)
+        logger.log(level, "%s 완료", phase, extra={"duration_ms": duration_ms})
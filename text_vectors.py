@@ -0,0 +1,45 @@
+"""
+문자 n-gram 해시 벡터
+답글/리뷰 텍스트를 고정 길이 벡터로 변환하여 코사인 유사도 계산에 사용
+"""
+
+from typing import List
+import zlib
+
+import numpy as np
+
+
+# 문자 n-gram 크기 (한국어는 2~3글자 조합이 표현 단위를 잘 반영)
+NGRAM_SIZES = (2, 3)
+
+# 해시 벡터 차원
+DEFAULT_DIM = 512
+
+
+def normalize_text(text: str) -> str:
+    """공백 정리 및 소문자 변환"""
+    return " ".join(text.lower().split())
+
+
+def char_ngrams(text: str, sizes=NGRAM_SIZES) -> List[str]:
+    """문자 n-gram 목록"""
+    text = normalize_text(text)
+    grams = []
+    for n in sizes:
+        grams.extend(text[i:i + n] for i in range(len(text) - n + 1))
+    return grams
+
+
+def hashed_ngram_vector(text: str, dim: int = DEFAULT_DIM) -> np.ndarray:
+    """L2 정규화된 n-gram 해시 벡터 (float32)
+
+    hash()는 실행마다 값이 달라지므로 디스크에 저장할 벡터는 crc32로 해시
+    """
+    vector = np.zeros(dim, dtype=np.float32)
+    for gram in char_ngrams(text):
+        vector[zlib.crc32(gram.encode("utf-8")) % dim] += 1.0
+
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
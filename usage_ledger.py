@@ -0,0 +1,179 @@
+"""
+토큰 및 비용 사용량 장부
+업체별·일자별·모델별로 프롬프트/완성 토큰을 누적 저장하고 예산 상태를 판단
+"""
+
+from typing import Dict, Optional
+from datetime import date
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+# 모델별 100만 토큰당 가격 (USD)
+MODEL_PRICES = {
+    "gpt-4o-mini": {"prompt": 0.15, "completion": 0.60},
+    "gpt-4o": {"prompt": 2.50, "completion": 10.00},
+}
+
+# 예산 상태
+BUDGET_OK = "ok"
+BUDGET_TIGHT = "tight"
+BUDGET_EXCEEDED = "exceeded"
+
+
+class UsageLedger:
+    """사용량 장부 (JSON 파일에 영구 저장)"""
+
+    def __init__(
+        self,
+        ledger_file: str = "usage_ledger.json",
+        daily_budget: float = 0.0,
+        monthly_budget: float = 0.0,
+        warn_ratio: float = 0.8
+    ):
+        self.ledger_file = ledger_file
+        # 0 이하이면 해당 예산 제한 없음
+        self.daily_budget = daily_budget or 0.0
+        self.monthly_budget = monthly_budget or 0.0
+        self.warn_ratio = warn_ratio
+        self._lock = threading.Lock()
+        self.entries = self._load()
+
+    def _load(self) -> Dict:
+        """장부 파일 로드"""
+        if not os.path.exists(self.ledger_file):
+            return {}
+        try:
+            with open(self.ledger_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get("entries", {})
+        except Exception as e:
+            logger.warning("사용량 장부 로드 실패, 새로 시작합니다: %s", e)
+            return {}
+
+    def save(self):
+        """장부 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        tmp_file = self.ledger_file + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"entries": self.entries}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, self.ledger_file)
+
+    @staticmethod
+    def cost_for(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+        """토큰 수로 비용 계산 (가격표에 없는 모델은 0)"""
+        price = MODEL_PRICES.get(model)
+        if not price:
+            return 0.0
+        return (prompt_tokens * price["prompt"] + completion_tokens * price["completion"]) / 1_000_000
+
+    def record(
+        self,
+        business: str,
+        model: str,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        day: Optional[str] = None,
+        replies: int = 1
+    ) -> float:
+        """답글 사용량 기록, 해당 건의 비용 반환
+
+        답글 생성 시에는 replies=0으로 토큰만 기록하고, 답글이 등록되면 토큰 없이 replies만 기록
+        (등록에 실패한 답글은 답글 수에 포함되지 않아 답글당 비용이 실제보다 낮게 집계되지 않음)
+        """
+        day = day or date.today().isoformat()
+        cost = self.cost_for(model, prompt_tokens, completion_tokens)
+
+        with self._lock:
+            bucket = (
+                self.entries
+                .setdefault(business, {})
+                .setdefault(day, {})
+                .setdefault(model, {
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "replies": 0,
+                    "cost_usd": 0.0
+                })
+            )
+            bucket["prompt_tokens"] += prompt_tokens
+            bucket["completion_tokens"] += completion_tokens
+            bucket["replies"] += replies
+            bucket["cost_usd"] += cost
+
+            try:
+                self.save()
+            except Exception as e:
+                logger.error("사용량 장부 저장 실패: %s", e)
+
+        return cost
+
+    def _iter_buckets(self, business: Optional[str], day_prefix: str):
+        """조건에 맞는 (모델, 집계) 쌍 순회"""
+        for biz, days in self.entries.items():
+            if business is not None and biz != business:
+                continue
+            for day, models in days.items():
+                if not day.startswith(day_prefix):
+                    continue
+                for model, bucket in models.items():
+                    yield model, bucket
+
+    def daily_cost(self, business: Optional[str] = None, day: Optional[str] = None) -> float:
+        """일간 비용 (business가 None이면 전체 업체 합계)"""
+        day = day or date.today().isoformat()
+        return sum(b["cost_usd"] for _, b in self._iter_buckets(business, day))
+
+    def monthly_cost(self, business: Optional[str] = None, month: Optional[str] = None) -> float:
+        """월간 비용 (month 형식: YYYY-MM)"""
+        month = month or date.today().isoformat()[:7]
+        return sum(b["cost_usd"] for _, b in self._iter_buckets(business, month))
+
+    def budget_status(self) -> str:
+        """예산 상태: ok / tight(경고 비율 도달) / exceeded(초과)
+
+        예산은 OpenAI 청구 단위이므로 전체 업체 합계로 판단
+        """
+        ratios = []
+        if self.daily_budget > 0:
+            ratios.append(self.daily_cost() / self.daily_budget)
+        if self.monthly_budget > 0:
+            ratios.append(self.monthly_cost() / self.monthly_budget)
+
+        if not ratios:
+            return BUDGET_OK
+
+        worst = max(ratios)
+        if worst >= 1.0:
+            return BUDGET_EXCEEDED
+        if worst >= self.warn_ratio:
+            return BUDGET_TIGHT
+        return BUDGET_OK
+
+    def summary(self, business: Optional[str] = None, period: Optional[str] = None) -> Dict:
+        """기간별 사용량 요약 (period: YYYY-MM-DD, YYYY-MM 또는 None=오늘)"""
+        period = period or date.today().isoformat()
+
+        summary = {
+            "period": period,
+            "replies": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "cost_usd": 0.0,
+            "by_model": {}
+        }
+        for model, bucket in self._iter_buckets(business, period):
+            model_summary = summary["by_model"].setdefault(model, {"replies": 0, "cost_usd": 0.0})
+            model_summary["replies"] += bucket["replies"]
+            model_summary["cost_usd"] += bucket["cost_usd"]
+            summary["replies"] += bucket["replies"]
+            summary["prompt_tokens"] += bucket["prompt_tokens"]
+            summary["completion_tokens"] += bucket["completion_tokens"]
+            summary["cost_usd"] += bucket["cost_usd"]
+
+        summary["cost_per_reply"] = (
+            summary["cost_usd"] / summary["replies"] if summary["replies"] else 0.0
+        )
+        return summary